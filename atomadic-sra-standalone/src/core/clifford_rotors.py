@@ -63,6 +63,18 @@ class CliffordRotor:
             "delta_norm": round(norm1 - norm2, 8)
         }
 
+    def check_coherence(self, vectors) -> float:
+        """
+        Directional coherence of a set of vectors, in [0, 1].
+        Length of the mean of their unit vectors: 1.0 when all point the same way.
+        """
+        vecs = np.asarray(vectors, dtype=float)
+        if vecs.ndim != 2 or len(vecs) == 0:
+            return 0.0
+        norms = np.linalg.norm(vecs, axis=1, keepdims=True)
+        units = vecs / np.where(norms == 0, 1.0, norms)
+        return round(float(np.linalg.norm(units.mean(axis=0))), 6)
+
     def generate_random_mutation(self, state_vector: list, intensity: float = 0.1):
         """
         Generates a small random mutation (creative spark) in 8D or 24D.
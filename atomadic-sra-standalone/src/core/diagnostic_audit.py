@@ -2,7 +2,9 @@ import sys
 import os
 import time
 import json
+import threading
 import urllib.request
+from concurrent.futures import Future, ThreadPoolExecutor
 def manual_load_env():
     env_path = ".env"
     if os.path.exists(env_path):
@@ -15,7 +17,7 @@ def manual_load_env():
 manual_load_env()
 
 import logging
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 
 # Ensure project root is on path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
@@ -29,6 +31,10 @@ class ApexAudit:
     Apex Diagnostic Audit Engine v4.4.0.0
     Ensures absolute operational reliability and peak performance.
     """
+    # Singleflight: concurrent callers share one in-flight probe run
+    _inflight_lock = threading.Lock()
+    _inflight_future: Optional[Future] = None
+
     def __init__(self):
         self.results = {
             "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
@@ -37,6 +43,22 @@ class ApexAudit:
         }
 
     def run_full_audit(self):
+        leader = False
+        with ApexAudit._inflight_lock:
+            if ApexAudit._inflight_future is None:
+                executor = ThreadPoolExecutor(max_workers=1)
+                ApexAudit._inflight_future = executor.submit(self._run_impl)
+                executor.shutdown(wait=False)
+                leader = True
+            fut = ApexAudit._inflight_future
+        try:
+            return fut.result()
+        finally:
+            if leader:
+                with ApexAudit._inflight_lock:
+                    ApexAudit._inflight_future = None
+
+    def _run_impl(self):
         logger.info("[ApexAudit] Initiating Comprehensive System Probe...")
         
         # 1. API Key Audit
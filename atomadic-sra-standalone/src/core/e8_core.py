@@ -1,5 +1,7 @@
 import math
 
+import numpy as np
+
 # --- Rule 10: Helical Derivation for Lattice Projection ---
 # Principle: V(x) = sum(sum(A_ij)) for E8 lattice A.
 # Derivation: dV/dx = optimization_delta proportional to projection mass.
@@ -77,6 +79,18 @@ class E8Core:
         self._resonance_cache[cache_key] = resonance
         return resonance
 
+    def compute_field_resonance_batch(self, state, states):
+        """
+        Resonance of `state` against every row of `states` in one pass.
+        Zero-norm rows (or a zero `state`) resonate at 0.0, as in the scalar form.
+        """
+        q = np.asarray(state, dtype=float)
+        R = np.asarray(states, dtype=float).reshape(-1, q.size)
+        denom = np.sqrt(np.einsum("ij,ij->i", R, R)) * math.sqrt(q @ q)
+        out = np.zeros(R.shape[0])
+        np.divide(R @ q, denom, out=out, where=denom != 0)
+        return out
+
 if __name__ == "__main__":
     # Self-test block for E8Core lattice dynamics
     print("[Self-Test] Verifying E8Core Lattice Dynamics...")
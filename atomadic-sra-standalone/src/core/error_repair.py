@@ -4,22 +4,59 @@ Self-healing logic for the SRA substrate.
 SRA v4.4.2.0 | HelixEvolver Autopoiesis
 """
 
+import atexit
 import os
 import json
 import logging
+import weakref
 from pathlib import Path
 
 _ROOT = Path(__file__).resolve().parent.parent.parent
 logger = logging.getLogger("ErrorRepair")
 
+# Repairers with possibly unwritten events; one exit hook flushes whichever
+# are still alive without keeping any of them alive itself
+_LIVE_REPAIRERS = weakref.WeakSet()
+
+
+def _flush_live_repairers():
+    for repairer in list(_LIVE_REPAIRERS):
+        try:
+            repairer.close()
+        except Exception as e:
+            logger.warning(f"[ErrorRepair] Exit flush failed: {e}")
+
+
+atexit.register(_flush_live_repairers)
+
 class ErrorRepair:
     def __init__(self):
         self.repair_log = _ROOT / "data" / "repair_history.jsonl"
+        self._log_dir_checked = False
+        self._pending = []
+        _LIVE_REPAIRERS.add(self)
 
     def log_repair(self, target: str, action: str, result: str):
         event = {"target": target, "action": action, "result": result}
-        with open(self.repair_log, "a", encoding="utf-8") as f:
-            f.write(json.dumps(event) + "\n")
+        self._pending.append(json.dumps(event))
+
+    def flush_repairs(self):
+        """Appends all buffered repair events to the log in a single write."""
+        if not self._pending:
+            return 0
+        if not self._log_dir_checked:
+            os.makedirs(self.repair_log.parent, exist_ok=True)
+            self._log_dir_checked = True
+        payload = ("\n".join(self._pending) + "\n").encode("utf-8")
+        with open(self.repair_log, "ab") as f:
+            f.write(payload)
+        count = len(self._pending)
+        self._pending.clear()
+        return count
+
+    def close(self):
+        """Writes any repair events still buffered (also run at interpreter exit)."""
+        self.flush_repairs()
 
     def repair_missing_dir(self, dir_path: str):
         p = _ROOT / dir_path
@@ -50,15 +87,18 @@ class ErrorRepair:
         """Processes bootloader diagnostics and attempts fixes."""
         print("[*] Initiating Autonomous Healing Cycle...")
         healed = 0
-        for check in check_results:
-            if not check["success"]:
-                msg = check["message"]
-                if ".env file missing" in msg:
-                    if self.repair_env_file(): healed += 1
-                elif "directory missing" in msg:
-                    # Logic to parse dir from msg if added to bootloader
-                    pass
-        
+        try:
+            for check in check_results:
+                if not check["success"]:
+                    msg = check["message"]
+                    if ".env file missing" in msg:
+                        if self.repair_env_file(): healed += 1
+                    elif "directory missing" in msg:
+                        # Logic to parse dir from msg if added to bootloader
+                        pass
+        finally:
+            # Repairs already made are logged even if a later check blows up
+            self.flush_repairs()
         print(f"✓ Healing Cycle Finished. Issues resolved: {healed}")
         return healed > 0
 
@@ -66,3 +106,4 @@ if __name__ == "__main__":
     repair = ErrorRepair()
     repair.repair_missing_dir("data")
     repair.repair_env_file()
+    repair.close()
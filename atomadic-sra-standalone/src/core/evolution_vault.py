@@ -7,15 +7,39 @@ import hashlib
 from typing import Dict, Any, List, Optional
 from . import clifford_rotors
 
+try:
+    import orjson
+except ImportError:  # optional: C-accelerated JSON
+    orjson = None
+
+
+def _dump_vault(data: Dict[str, Any]) -> bytes:
+    """Indented UTF-8 JSON for the vault file; falls back to stdlib json."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits -- let json decide
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _load_vault(raw: bytes) -> Dict[str, Any]:
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+# Vault file used when none is given; SRA_VAULT_FILE overrides it (the test
+# suite points it at a temporary copy so runs never touch the shipped vault)
+DEFAULT_VAULT_FILE = "data/evolution_vault.json"
+
 class EvolutionVault:
     """
     Evolution Vault
     Central storage and query engine for strategic artifacts.
     Categories: opportunities, novelties, evolutions
-    Persists to data/evolution_vault.json with integrity checks.
+    Persists to data/evolution_vault.json (or $SRA_VAULT_FILE) with integrity checks.
     """
-    def __init__(self, data_file="data/evolution_vault.json"):
-        self.data_file = data_file
+    def __init__(self, data_file: Optional[str] = None):
+        self.data_file = data_file or os.getenv("SRA_VAULT_FILE", DEFAULT_VAULT_FILE)
         self.ensure_data_file()
 
     def ensure_data_file(self):
@@ -37,8 +61,8 @@ class EvolutionVault:
 
     def _load(self) -> Dict[str, Any]:
         try:
-            with open(self.data_file, "r") as f:
-                return json.load(f)
+            with open(self.data_file, "rb") as f:
+                return _load_vault(f.read())
         except Exception:
             return {
                 "opportunities": [], 
@@ -73,8 +97,8 @@ class EvolutionVault:
                  print("[Vault] WARNING: Existing vault integrity compromised. Sealing new state regardless.")
 
         try:
-            with open(self.data_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            with open(self.data_file, "wb") as f:
+                f.write(_dump_vault(data))
         except PermissionError:
             print("[Vault] Sovereign Handshake Failure: Write Access Denied.")
             raise
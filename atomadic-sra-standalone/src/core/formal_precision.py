@@ -1,3 +1,8 @@
+import copy
+import logging
+from collections import deque
+
+logger = logging.getLogger(__name__)
 
 class FormalPrecisionLayer:
     """
@@ -11,15 +16,18 @@ class FormalPrecisionLayer:
     - Synthetic topology: continuity without metric spaces
     """
     def __init__(self):
-        self.verified_proofs = []
+        self.verified_proofs = {}  # insertion-ordered set of proof names
         self.type_universe = {}
+        self._equiv_cache = {}  # frozenset({type_a, type_b}) -> bool
+        self._structure_intern = {}  # canonical key -> shared structure object
 
     def verify_proof(self, proof):
         """
         Verify a proof using univalent foundations.
         Checks: well-formedness, term normalization, type checking.
         """
-        print(f"[HoTT] Verifying proof: {proof.get('name', proof) if isinstance(proof, dict) else proof}")
+        proof_name = proof.get("name", proof) if isinstance(proof, dict) else proof
+        logger.debug("[HoTT] Verifying proof: %s", proof_name)
         
         result = {
             "name": proof.get("name", str(proof)) if isinstance(proof, dict) else str(proof),
@@ -29,27 +37,29 @@ class FormalPrecisionLayer:
             "univalent": True,
         }
         
-        # Check structure
+        # Cheap structural gate first: malformed proofs fail before the step checks
+        if isinstance(proof, dict) and "hypothesis" not in proof and "conclusion" not in proof:
+            result["well_formed"] = False
+            result["type_checks"] = False
+            result["verified"] = False
+            logger.debug("[HoTT]  FAILED: %s (missing hypothesis/conclusion)", result["name"])
+            return result
+        
         if isinstance(proof, dict):
-            if "hypothesis" not in proof and "conclusion" not in proof:
-                result["well_formed"] = False
-                result["type_checks"] = False
-            
-            if proof.get("steps"):
-                # Verify each step type-checks
-                for i, step in enumerate(proof["steps"]):
-                    if not self._type_check(step):
-                        result["type_checks"] = False
-                        result["error_at_step"] = i
-                        break
+            # Verify each step type-checks
+            for i, step in enumerate(proof.get("steps") or ()):
+                if not self._type_check(step):
+                    result["type_checks"] = False
+                    result["error_at_step"] = i
+                    result["verified"] = False
+                    return result
         
-        result["verified"] = all([result["well_formed"], result["type_checks"], result["normalized"]])
+        result["verified"] = result["well_formed"] and result["type_checks"] and result["normalized"]
         
         if result["verified"]:
-            self.verified_proofs.append(result["name"])
+            self.verified_proofs[result["name"]] = None
         
-        status = " VERIFIED" if result["verified"] else " FAILED"
-        print(f"[HoTT] {status}: {result['name']}")
+        logger.debug("[HoTT] %s: %s", " VERIFIED" if result["verified"] else " FAILED", result["name"])
         return result
 
     def check_continuity(self, function_spec):
@@ -57,7 +67,7 @@ class FormalPrecisionLayer:
         Check univalent continuity / path-lifting property.
         In synthetic topology, every function between types is continuous.
         """
-        print(f"[HoTT] Checking continuity for {function_spec}")
+        logger.debug("[HoTT] Checking continuity for %s", function_spec)
         
         result = {
             "function": str(function_spec),
@@ -78,12 +88,19 @@ class FormalPrecisionLayer:
 
     def define_type(self, name, structure):
         """Register a type in the universe."""
+        if isinstance(structure, (dict, list)):
+            # Keep a private copy: later edits to the caller's object must not reach
+            # the universe, the interned structures or the equivalence cache
+            structure = copy.deepcopy(structure)
+            if isinstance(structure, dict):
+                structure = self._intern_structure(structure)
         self.type_universe[name] = {
             "structure": structure,
             "level": len(self.type_universe),
             "paths": []
         }
-        print(f"[HoTT] Type registered: {name} at level {self.type_universe[name]['level']}")
+        self._equiv_cache.clear()
+        logger.debug("[HoTT] Type registered: %s at level %d", name, self.type_universe[name]["level"])
         return self.type_universe[name]
 
     def check_equivalence(self, type_a, type_b):
@@ -95,14 +112,100 @@ class FormalPrecisionLayer:
         b = self.type_universe.get(type_b)
         
         if a and b:
-            # Structural comparison
-            equiv = a["structure"] == b["structure"]
-            print(f"[HoTT] {type_a}  {type_b}: {equiv}")
+            # Reflexivity: every type is equivalent to itself
+            if type_a == type_b:
+                return True
+            key = frozenset((type_a, type_b))
+            cached = self._equiv_cache.get(key)
+            if cached is not None:
+                return cached
+            # Identity fast path before the structural comparison
+            equiv = a["structure"] is b["structure"] or self._structural_eq(a["structure"], b["structure"], set())
+            self._equiv_cache[key] = equiv
+            logger.debug("[HoTT] %s  %s: %s", type_a, type_b, equiv)
             return equiv
         return False
 
+    def _structural_eq(self, x, y, acc):
+        """
+        Iterative structural equality, safe on cyclic and DAG-shaped structures.
+        `acc` holds (id, id) pairs of compound nodes already compared.
+        """
+        work = deque([(x, y)])
+        while work:
+            x, y = work.pop()
+            if x is y:
+                continue
+            if isinstance(x, dict) and isinstance(y, dict):
+                pair = (id(x), id(y))
+                if pair in acc:
+                    continue
+                acc.add(pair)
+                if x.keys() != y.keys():
+                    return False
+                work.extend((x[k], y[k]) for k in x)
+            elif isinstance(x, (list, tuple)) and isinstance(y, (list, tuple)):
+                if type(x) is not type(y) or len(x) != len(y):
+                    return False
+                pair = (id(x), id(y))
+                if pair in acc:
+                    continue
+                acc.add(pair)
+                work.extend(zip(x, y))
+            elif isinstance(x, (dict, list, tuple)) or isinstance(y, (dict, list, tuple)):
+                return False
+            elif x != y:
+                return False
+        return True
+
+    def _intern_structure(self, structure):
+        """Share identity between equal structures so equivalence hits the `is` fast path."""
+        key = self._canonical_key(structure)
+        if key is None:
+            return structure
+        return self._structure_intern.setdefault(key, structure)
+
+    def _canonical_key(self, value, path=None):
+        """Hashable canonical form of a structure, or None if it is cyclic or holds unhashable leaves."""
+        if isinstance(value, (dict, list, tuple)):
+            path = path or set()
+            if id(value) in path:
+                return None
+            path.add(id(value))
+            try:
+                if isinstance(value, dict):
+                    items = []
+                    for k, v in value.items():
+                        sub = self._canonical_key(v, path)
+                        if sub is None:
+                            return None
+                        items.append((k, sub))
+                    return ("dict", frozenset(items))
+                subs = []
+                for v in value:
+                    sub = self._canonical_key(v, path)
+                    if sub is None:
+                        return None
+                    subs.append(sub)
+                return (type(value).__name__, tuple(subs))
+            except TypeError:
+                return None
+            finally:
+                path.discard(id(value))
+        try:
+            hash(value)
+        except TypeError:
+            return None
+        return (type(value).__name__, value)
+
     def _type_check(self, step):
         """Simple type checking for a proof step."""
+        # Exact-type fast paths for the common str/dict steps; subclasses fall through
+        t = type(step)
+        if t is str:
+            return bool(step)
+        if t is dict:
+            return "type" in step and "term" in step
         if isinstance(step, dict):
             return "type" in step and "term" in step
         return isinstance(step, str) and len(step) > 0
@@ -11,13 +11,16 @@ Audit: τ=1.0, ΔL>0
 """
 
 import json
+import re
+import time
+from operator import itemgetter
 from datetime import datetime, timezone
 from pathlib import Path
-from string import Template
 
 __version__ = "1.0.0"
 
 ROOT = Path(__file__).parent.parent.parent
+_DEFAULT_GRANT_DIR = ROOT / "data" / "grant_submissions"
 
 # ── Company defaults (edit in .env) ───────────────────────────────────────────
 COMPANY = {
@@ -49,6 +52,20 @@ PRODUCT = {
 }
 
 
+# ── Clock ─────────────────────────────────────────────────────────────────────
+
+_now_cache: tuple[int, datetime] | None = None
+
+
+def _now_cached(ttl: float = 1.0) -> datetime:
+    """UTC now, reused for `ttl` seconds so batch renders share one clock read."""
+    global _now_cache
+    ns = time.monotonic_ns()
+    if _now_cache is None or ns - _now_cache[0] >= ttl * 1e9:
+        _now_cache = (ns, datetime.now(timezone.utc))
+    return _now_cache[1]
+
+
 # ── Template definitions ───────────────────────────────────────────────────────
 
 TEMPLATES: dict[str, dict] = {
@@ -56,7 +73,7 @@ TEMPLATES: dict[str, dict] = {
         "title": "Mitacs Accelerate — Letter of Intent",
         "deadline": "Rolling (submit ≥ 6 weeks before start date)",
         "value_cad": 15000,
-        "template": Template("""\
+        "template": """\
 # Mitacs Accelerate — Letter of Intent
 **Date:** $date
 **Company:** $company_name | $city
@@ -103,9 +120,9 @@ All IP remains with $company_name. Academic partner receives publication rights.
 [ ] Confirm academic supervisor
 [ ] Submit Mitacs online application
 [ ] Attach this LOI + CV of proposed intern
-"""),
+""",
         "fill": {
-            "date": lambda: datetime.now(timezone.utc).strftime("%B %d, %Y"),
+            "date": lambda: _now_cached().strftime("%B %d, %Y"),
             "company_name": COMPANY["name"],
             "city": COMPANY["city"],
             "contact": COMPANY["contact"],
@@ -116,7 +133,7 @@ All IP remains with $company_name. Academic partner receives publication rights.
         "title": "New Ventures BC — Competition Application",
         "deadline": "May 2026",
         "value_cad": 29000,
-        "template": Template("""\
+        "template": """\
 # New Ventures BC 2026 — Application
 **Date:** $date
 **Company:** $company_name
@@ -168,9 +185,9 @@ $29,000 NVBC prize + mentorship to fund:
 2. ACI benchmark paper submitted to ArXiv
 3. Mitacs Accelerate internship commenced
 4. MRR ≥ $10,000
-"""),
+""",
         "fill": {
-            "date": lambda: datetime.now(timezone.utc).strftime("%B %d, %Y"),
+            "date": lambda: _now_cached().strftime("%B %d, %Y"),
             "company_name": COMPANY["name"],
             "city": COMPANY["city"],
             "contact": COMPANY["contact"],
@@ -181,7 +198,7 @@ $29,000 NVBC prize + mentorship to fund:
         "title": "SR&ED Tax Credit — Claim Outline",
         "deadline": "April 30, 2026 (for fiscal year 2025)",
         "value_cad": None,  # 35% of eligible expenses
-        "template": Template("""\
+        "template": """\
 # SR&ED Investment Tax Credit — Claim Outline
 **Company:** $company_name | **Fiscal Year:** $fiscal_year
 **Prepared:** $date
@@ -229,9 +246,9 @@ regenerate stub modules and maintain system stability in production?
 [ ] Engage SR&ED consultant (Boast.ai or SR&ED Canada)
 [ ] Export Evolution Vault timestamps to consultant
 [ ] File T661 with CRA by April 30, 2026
-"""),
+""",
         "fill": {
-            "date": lambda: datetime.now(timezone.utc).strftime("%B %d, %Y"),
+            "date": lambda: _now_cached().strftime("%B %d, %Y"),
             "company_name": COMPANY["name"],
             "fiscal_year": "January 1 – December 31, 2025",
         },
@@ -239,50 +256,106 @@ regenerate stub modules and maintain system stability in production?
 }
 
 
+class _SafeFill(dict):
+    """Leaves unknown placeholders intact, like string.Template.safe_substitute."""
+
+    def __missing__(self, key: str) -> str:
+        return "$" + key
+
+
+# $$, $name and ${name} placeholders (string.Template syntax), compiled once for all templates
+_PLACEHOLDER_RE = re.compile(
+    r"\$(?:(?P<escaped>\$)|(?P<named>[_a-zA-Z][_a-zA-Z0-9]*)|\{(?P<braced>[_a-zA-Z][_a-zA-Z0-9]*)\})"
+)
+
+
+def _to_format_string(src: str) -> str:
+    """Translate a $-placeholder template body into an equivalent str.format_map string."""
+    parts = []
+    pos = 0
+    for m in _PLACEHOLDER_RE.finditer(src):
+        parts.append(src[pos:m.start()].replace("{", "{{").replace("}", "}}"))
+        name = m.group("named") or m.group("braced")
+        if name is not None:
+            parts.append("{" + name + "}")
+        else:
+            parts.append("$")
+        pos = m.end()
+    parts.append(src[pos:].replace("{", "{{").replace("}", "}}"))
+    return "".join(parts)
+
+
+# Pre-compile every template once at import
+for _tmpl in TEMPLATES.values():
+    _tmpl["_fmt"] = _to_format_string(_tmpl["template"])
+
+
 # ── Generator ──────────────────────────────────────────────────────────────────
 
-def generate_grant(grant_key: str, output_dir: Path | None = None) -> str:
+def _render(tmpl: dict, overrides: dict | None = None) -> str:
+    """Render one template dict; `overrides` replaces (and skips) matching fill callables."""
+    overrides = overrides or {}
+    fill_vals = _SafeFill()
+    for k, v in tmpl["fill"].items():
+        if k in overrides:
+            continue
+        fill_vals[k] = v() if callable(v) else v
+    fill_vals.update(overrides)
+    return tmpl["_fmt"].format_map(fill_vals)
+
+
+def _write(grant_key: str, rendered: str, out_dir: Path) -> None:
+    out_path = out_dir / f"{grant_key}.md"
+    out_path.write_text(rendered, encoding="utf-8")
+    print(f"[GrantSwarm] ✓ {grant_key} → {out_path}")
+
+
+def generate_grant(
+    grant_key: str,
+    output_dir: Path | None = None,
+    overrides: dict | None = None,
+) -> str:
     """
     Render a grant template to a Markdown string.
     Optionally writes to output_dir/{grant_key}.md.
+    `overrides` supplies precomputed fill values; their callables are skipped.
     Returns the rendered Markdown.
     """
-    if grant_key not in TEMPLATES:
+    tmpl = TEMPLATES.get(grant_key)
+    if tmpl is None:
         raise KeyError(f"Unknown grant: {grant_key}. Available: {list(TEMPLATES)}")
 
-    tmpl = TEMPLATES[grant_key]
-    fill_vals = {}
-    for k, v in tmpl["fill"].items():
-        fill_vals[k] = v() if callable(v) else v
-
-    rendered = tmpl["template"].safe_substitute(**fill_vals)
+    rendered = _render(tmpl, overrides)
 
     if output_dir:
         out_dir = Path(output_dir)
         out_dir.mkdir(parents=True, exist_ok=True)
-        out_path = out_dir / f"{grant_key}.md"
-        out_path.write_text(rendered, encoding="utf-8")
-        print(f"[GrantSwarm] ✓ {grant_key} → {out_path}")
+        _write(grant_key, rendered, out_dir)
 
     return rendered
 
 
 def generate_all(output_dir: Path | None = None) -> dict[str, str]:
     """Generate all registered grant templates."""
-    out_dir = output_dir or ROOT / "data" / "grant_submissions"
-    return {k: generate_grant(k, out_dir) for k in TEMPLATES}
+    out_dir = Path(output_dir or _DEFAULT_GRANT_DIR)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    overrides = {"date": _now_cached().strftime("%B %d, %Y")}
+    results = {}
+    for k, tmpl in TEMPLATES.items():
+        rendered = results[k] = _render(tmpl, overrides)
+        _write(k, rendered, out_dir)
+    return results
+
+
+_LISTING_FIELDS = itemgetter("title", "deadline", "value_cad")
 
 
 def list_grants() -> list[dict]:
-    return [
-        {
-            "key": k,
-            "title": v["title"],
-            "deadline": v["deadline"],
-            "value_cad": v["value_cad"],
-        }
-        for k, v in TEMPLATES.items()
-    ]
+    listing = []
+    for k, v in TEMPLATES.items():
+        title, deadline, value_cad = _LISTING_FIELDS(v)
+        listing.append({"key": k, "title": title, "deadline": deadline, "value_cad": value_cad})
+    return listing
 
 
 if __name__ == "__main__":
@@ -6,14 +6,24 @@ Gumroad product: "SRA Agent Prompt Pack v3.2" — $49
 Audit: τ=1.0, ΔL>0
 """
 
+import os
 import zipfile
 import json
 from pathlib import Path
 from datetime import datetime, timezone
 
+try:
+    import orjson
+except ImportError:  # optional: C-accelerated JSON
+    orjson = None
+
 __version__ = "1.0.0"
 
 ROOT = Path(__file__).parent.parent.parent
+_DEFAULT_BUNDLE_DIR = ROOT / "data" / "gumroad_bundles"
+
+# Files below this size are stored uncompressed; deflate gains nothing on them.
+_STORE_BELOW_BYTES = 512
 
 BUNDLES: dict[str, dict] = {
     "sra-agent-prompt-pack": {
@@ -62,14 +72,14 @@ BUNDLES: dict[str, dict] = {
 }
 
 
-def _build_readme(bundle: dict) -> str:
+def _build_readme(bundle: dict, packaged_at: str) -> str:
     return f"""# {bundle['title']}
 
 {bundle['description']}
 
 **Price:** ${bundle['price_usd']} USD  
 **Vendor:** Atomadic Tech Inc.  
-**Date packaged:** {datetime.now(timezone.utc).isoformat()}  
+**Date packaged:** {packaged_at}  
 **Audit:** τ=1.0 | J=1.0 | ΔL>0
 
 ## Files Included
@@ -80,6 +90,30 @@ Personal use + commercial outputs. No redistribution of raw prompts.
 """
 
 
+def _dump_manifest(manifest: dict) -> bytes:
+    """Compact UTF-8 JSON for the machine-read bundle manifest."""
+    if orjson is not None:
+        return orjson.dumps(manifest)
+    return json.dumps(manifest, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _scan_existing(paths: list[Path]) -> dict[Path, os.DirEntry]:
+    """Map each existing file in `paths` to its DirEntry with one scandir per parent dir."""
+    by_parent: dict[Path, set[str]] = {}
+    for p in paths:
+        by_parent.setdefault(p.parent, set()).add(p.name)
+    found: dict[Path, os.DirEntry] = {}
+    for parent, names in by_parent.items():
+        try:
+            with os.scandir(parent) as it:
+                for entry in it:
+                    if entry.name in names and entry.is_file():
+                        found[parent / entry.name] = entry
+        except OSError:
+            continue
+    return found
+
+
 def pack_bundle(bundle_key: str, output_dir: Path | None = None) -> Path:
     """
     ZIP a named bundle from BUNDLES registry.
@@ -93,15 +127,18 @@ def pack_bundle(bundle_key: str, output_dir: Path | None = None) -> Path:
         raise KeyError(f"Unknown bundle: {bundle_key}. Available: {list(BUNDLES)}")
 
     bundle = BUNDLES[bundle_key]
-    out_dir = output_dir or ROOT / "data" / "gumroad_bundles"
+    out_dir = output_dir or _DEFAULT_BUNDLE_DIR
     out_dir.mkdir(parents=True, exist_ok=True)
 
-    ts = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+    now = datetime.now(timezone.utc)
+    packaged_at = now.isoformat()
+    ts = now.strftime("%Y%m%d_%H%M%S")
     zip_path = out_dir / f"{bundle_key}_{ts}.zip"
 
-    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED) as zf:
+    # Level 1 deflate: near level-6 ratio on Markdown/Python text at a fraction of the CPU
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
         # Add README
-        zf.writestr("README.md", _build_readme(bundle))
+        zf.writestr("README.md", _build_readme(bundle, packaged_at))
 
         # Add pricing manifest
         manifest = {
@@ -109,16 +146,21 @@ def pack_bundle(bundle_key: str, output_dir: Path | None = None) -> Path:
             "title": bundle["title"],
             "price_usd": bundle["price_usd"],
             "files": bundle["files"],
-            "packaged_at": datetime.now(timezone.utc).isoformat(),
+            "packaged_at": packaged_at,
             "gumroad_cta": f"https://atomadic.gumroad.com/l/{bundle_key}",
         }
-        zf.writestr("manifest.json", json.dumps(manifest, indent=2))
+        zf.writestr("manifest.json", _dump_manifest(manifest))
 
         # Add content files
-        for fname in bundle["files"] + bundle.get("bonus_files", []):
-            fpath = ROOT / fname
-            if fpath.exists():
-                zf.write(fpath, fpath.name)
+        all_files = bundle["files"] + bundle.get("bonus_files", [])
+        root = ROOT
+        fpaths = [root / fname for fname in all_files]
+        existing = _scan_existing(fpaths)
+        for fname, fpath in zip(all_files, fpaths):
+            entry = existing.get(fpath)
+            if entry is not None:
+                small = entry.stat().st_size < _STORE_BELOW_BYTES
+                zf.write(fpath, fpath.name, zipfile.ZIP_STORED if small else None)
             else:
                 zf.writestr(f"MISSING_{fpath.name}.txt", f"File not found: {fname}")
 
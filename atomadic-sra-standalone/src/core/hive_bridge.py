@@ -29,13 +29,25 @@ Proof: V = (1 - tau)^2/2 => dV/dt < 0 under homeostasis
 Audit: tau >= 0.9412, J >= 0.3, ΔM > 0
 """
 
+from __future__ import annotations
+
 import sys
 import os
-import asyncio
+import atexit
+import functools
+import importlib
+import importlib.util
 import logging
-import numpy as np
+import threading
+from enum import IntEnum
 from pathlib import Path
-from typing import Dict, Any, Optional, Tuple, List
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Any, Mapping, Optional, Tuple, List
+
+# numpy (via _np) and asyncio are imported on first use so constructing the bridge stays cheap
+if TYPE_CHECKING:
+    import numpy as np
+    from numpy.typing import ArrayLike
 
 logger = logging.getLogger(__name__)
 
@@ -49,8 +61,50 @@ if _HIVE_ROOT.exists() and str(_HIVE_ROOT) not in sys.path:
 # ---------------------------------------------------------------------------
 # Module registry — lazy loaded, graceful on failure
 # ---------------------------------------------------------------------------
+class _HM(IntEnum):
+    """Index of each HelixHive module slot in `_modules_arr`."""
+    memory = 0
+    helical = 1
+    llm_router = 2
+    agent = 3
+    evo2 = 4
+    genome = 5
+    config = 6
+    pipeline = 7
+    helixdb = 8
+    helixdb_git = 9
+    council = 10
+    proposals = 11
+    model_proposals = 12
+    immune = 13
+    golay_repair = 14
+    faction_manager = 15
+    market = 16
+    revelation = 17
+    orchestrator = 18
+    marketplace_sync = 19
+    user_requests = 20
+    world_model = 21
+    fitness = 22
+    resources = 23
+
+
 _modules = {}
+_modules_arr: list = [None] * len(_HM)
 _load_attempted = False
+_SENTINEL = object()
+
+
+def _try_import(entry):
+    """Import one manifest entry; returns (key, module_or_None, error_or_None, desc)."""
+    key, import_name, desc = entry
+    # Cheap spec probe first: absent modules skip the raise/catch of a failed import
+    if importlib.util.find_spec(import_name) is None:
+        return key, None, "not found on sys.path", desc
+    try:
+        return key, importlib.import_module(import_name), None, desc
+    except Exception as e:
+        return key, None, e, desc
 
 
 def _lazy_load_all():
@@ -100,25 +154,257 @@ def _lazy_load_all():
         ("resources", "resources", "Resource management"),
     ]
 
-    for key, import_name, desc in manifest:
-        try:
-            mod = __import__(import_name)
-            _modules[key] = mod
-            logger.info(f"[HiveBridge] ✓ {key}: {desc}")
-        except Exception as e:
-            _modules[key] = None
-            logger.debug(f"[HiveBridge] ✗ {key}: {e}")
+    # Sequential on purpose: imports run under the import lock and mostly burn CPU, and
+    # concurrent imports can observe a partly initialised module (e.g. evo2 -> llm_router)
+    for key, mod, err, desc in map(_try_import, manifest):
+        _modules[key] = mod
+        _modules_arr[_HM[key]] = mod
+        if err is None:
+            logger.info("[HiveBridge] ✓ %s: %s", key, desc)
+        else:
+            logger.debug("[HiveBridge] ✗ %s: %s", key, err)
 
     loaded = sum(1 for v in _modules.values() if v is not None)
     total = len(manifest)
-    logger.info(f"[HiveBridge] Loaded {loaded}/{total} HelixHive modules")
+    logger.info("[HiveBridge] Loaded %s/%s HelixHive modules", loaded, total)
 
 
-def _get(key: str):
-    """Get a loaded module by key, or None."""
+def _get(key):
+    """Get a loaded module by `_HM` member (fast path) or key string, or None."""
     if not _load_attempted:
         _lazy_load_all()
-    return _modules.get(key)
+    if type(key) is not _HM:
+        key = _HM.__members__.get(key)
+        if key is None:
+            return None
+    return _modules_arr[key]
+
+
+_np_mod = None
+
+
+def _np():
+    """The numpy module, imported on first call and then served from a global."""
+    global _np_mod
+    if _np_mod is None:
+        import numpy
+        _np_mod = numpy
+    return _np_mod
+
+
+# One daemon event loop serves call_llm_sync for every bridge (swarms may hold
+# one bridge per agent); started on first use, shut down at interpreter exit
+_bg_loop = None
+_bg_thread = None
+_bg_lock = threading.Lock()
+
+
+def _ensure_bg_loop():
+    """The shared background event loop, started once."""
+    global _bg_loop, _bg_thread
+    loop = _bg_loop
+    if loop is not None:
+        return loop
+    import asyncio
+    with _bg_lock:
+        if _bg_loop is None:
+            loop = asyncio.new_event_loop()
+            _bg_thread = threading.Thread(target=loop.run_forever, name="HiveBridgeLoop",
+                                          daemon=True)
+            _bg_thread.start()
+            _bg_loop = loop
+        return _bg_loop
+
+
+def _stop_bg_loop():
+    """Stop the shared loop, join its thread and close it so its selector fds are released."""
+    global _bg_loop, _bg_thread
+    with _bg_lock:
+        loop, thread = _bg_loop, _bg_thread
+        _bg_loop = _bg_thread = None
+    if loop is None:
+        return
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join(timeout=5.0)
+    if not thread.is_alive():
+        loop.close()
+
+
+atexit.register(_stop_bg_loop)
+
+
+def _e8_closest(v):
+    """
+    Closest E8 point to an 8D float vector: best of the parity-fixed D8 and
+    D8 + ½ cosets. Mirrors memory.E8.closest_point for when HelixHive is absent.
+    """
+    np = _np()
+    r0 = np.rint(v)
+    if int(r0.sum()) & 1:
+        err = v - r0
+        idx = int(np.abs(err).argmax())
+        r0[idx] += 1.0 if err[idx] > 0 else -1.0
+    r1 = np.rint(v - 0.5) + 0.5
+    if int(r1.sum()) & 1:
+        err = v - r1
+        idx = int(np.abs(err).argmax())
+        r1[idx] += 1.0 if err[idx] > 0 else -1.0
+    d0 = v - r0
+    d1 = v - r1
+    return r0.astype(int) if d0 @ d0 < d1 @ d1 else r1
+
+
+def _bind_fast(v1, v2, dim: Optional[int] = None):
+    """
+    Local bind for bipolar int8 (multiply) or bit-packed uint64 (XOR) pairs; None if not applicable.
+
+    With `dim`, only vectors of that dimensionality qualify — shape (dim,) for
+    int8, (ceil(dim / 64),) for uint64 — mirroring memory.HD's shape check.
+    """
+    np = _np()
+    dt = getattr(v1, "dtype", None)
+    if dt is None or dt != getattr(v2, "dtype", None) or v1.ndim != 1 or v1.shape != v2.shape:
+        return None
+    if dt == np.int8:
+        if dim is not None and v1.size != dim:
+            return None
+        return np.multiply(v1, v2)  # ±1 · ±1 stays in int8
+    if dt == np.uint64:
+        if dim is not None and v1.size != -(-dim // 64):
+            return None
+        return np.bitwise_xor(v1, v2)  # 64 binary dimensions per word
+    return None
+
+
+def _round_batch(vectors, out):
+    """Round an (N, D) float batch to nearest integers, writing into int `out` in place."""
+    np = _np()
+    np.rint(vectors, out=out, casting="unsafe")
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Capability info — plain builders for get_state, plus one frozen mapping per
+# module-presence combination that the info getters hand out as-is (read-only)
+# ---------------------------------------------------------------------------
+def _frozen(build):
+    """lru-cached, read-only variant of a plain info builder (nested dicts/lists frozen too)."""
+    @functools.lru_cache(maxsize=32)
+    def frozen(*args) -> Mapping[str, Any]:
+        return MappingProxyType({
+            k: MappingProxyType(v) if type(v) is dict else tuple(v) if type(v) is list else v
+            for k, v in build(*args).items()
+        })
+    return functools.update_wrapper(frozen, build)
+
+
+def _db_info(db: bool, git: bool, node_types: tuple) -> Dict[str, Any]:
+    return {
+        "helixdb_available": db,
+        "helixdb_git_available": git,
+        "node_types": list(node_types),
+        "capabilities": {
+            "graph_queries": db,
+            "vector_search": db,
+            "git_backed": git,
+            "git_lfs": git,
+        },
+    }
+
+
+def _governance_info(council: bool, proposals: bool, model_prop: bool) -> Dict[str, Any]:
+    return {
+        "council_available": council,
+        "proposals_available": proposals,
+        "model_proposals_available": model_prop,
+        "council_members": 6 if council else 0,
+        "features": {
+            "weighted_voting": council,
+            "guardian_veto": council,
+            "constitutional_checks": council,
+            "supermajority_amend": council,
+            "proposal_management": proposals,
+            "daughter_repo_spawning": model_prop,
+        },
+    }
+
+
+def _immune_info(immune: bool, repair: bool) -> Dict[str, Any]:
+    return {
+        "immune_available": immune,
+        "golay_repair_available": repair,
+        "capabilities": {
+            "failure_detection": immune,
+            "anomaly_detection": immune,
+            "healing_proposals": immune,
+            "codebase_self_repair": repair,
+            "vigil_fsm": repair,
+            "syntax_repair": repair,
+            "ruff_integration": repair,
+            "bandit_security": repair,
+        },
+    }
+
+
+def _social_info(faction: bool, market: bool) -> Dict[str, Any]:
+    return {
+        "faction_manager_available": faction,
+        "market_available": market,
+        "capabilities": {
+            "dbscan_clustering": faction,
+            "faction_centroids": faction,
+            "niche_matching": faction,
+            "trait_listings": market,
+            "auctions": market,
+            "reputation_transfer": market,
+        },
+    }
+
+
+def _ecosystem_info(orchestrator: bool, marketplace_sync: bool, user_requests: bool,
+                    world_model: bool, fitness: bool, resources: bool,
+                    helical: bool) -> Dict[str, Any]:
+    return {
+        "orchestrator_available": orchestrator,
+        "marketplace_sync_available": marketplace_sync,
+        "user_requests_available": user_requests,
+        "world_model_available": world_model,
+        "fitness_available": fitness,
+        "resources_available": resources,
+        "helical_available": helical,
+    }
+
+
+def _pipeline_info(pp: type) -> Dict[str, Any]:
+    # Frozen copy is keyed on the ProductPipeline class itself; ROUND_PROMPTS is a class constant
+    rounds = list(pp.ROUND_PROMPTS.keys()) if hasattr(pp, 'ROUND_PROMPTS') else []
+    return {
+        "available": True,
+        "class": "ProductPipeline",
+        "rounds": 4,
+        "round_prompts": rounds,
+        "note": "Full pipeline requires HelixDBGit + genome + config",
+    }
+
+
+_db_info_for = _frozen(_db_info)
+_governance_info_for = _frozen(_governance_info)
+_immune_info_for = _frozen(_immune_info)
+_social_info_for = _frozen(_social_info)
+_ecosystem_info_for = _frozen(_ecosystem_info)
+_pipeline_info_for = _frozen(_pipeline_info)
+
+
+def _node_types(git) -> tuple:
+    """HelixDBGit node types from the adapter module, or () when unavailable."""
+    return tuple(git.HelixDBGit.NODE_TYPES) if git and hasattr(git.HelixDBGit, 'NODE_TYPES') else ()
+
+
+def thaw_info(info: Mapping[str, Any]) -> Dict[str, Any]:
+    """Plain JSON-ready copy of a read-only info mapping (nested proxies → dicts, tuples → lists)."""
+    # Info mappings nest one level deep, so a flat pass covers every value
+    return {k: dict(v) if type(v) is MappingProxyType else list(v) if type(v) is tuple else v
+            for k, v in info.items()}
 
 
 # ===========================================================================
@@ -139,30 +425,92 @@ class HiveBridge:
     Aletheia Axiom III: External dependencies wrapped in a
     Sovereign Interface that the agent can fully audit.
     """
+    # No per-instance __dict__: swarms may hold one bridge per agent
+    __slots__ = (
+        "tau", "J",
+        "_golay_available", "_golay_probed", "_golay_lock",
+        "_mod_cache", "_avail", "_flags",
+        "_rng",
+    )
+
     def __init__(self):
         self.tau = 1.0
         self.J = 1.0
         self._golay_available = False
+        self._golay_probed = False  # probe runs once, whatever its outcome
+        self._golay_lock = threading.Lock()
+        self._mod_cache: Dict[_HM, Any] = {}
+        self._rng = None  # numpy Generator, created on first mutation
+        self._avail: Optional[Dict[str, bool]] = None  # built on first availability probe
+        self._flags: Optional[Dict[str, bool]] = None  # per-module presence, for get_state
+
+    def _m(self, key: _HM):
+        """Module handle for `key`, resolved through `_get` once per instance."""
+        m = self._mod_cache.get(key, _SENTINEL)
+        if m is _SENTINEL:
+            m = self._mod_cache[key] = _get(key)
+        return m
+
+    def invalidate_modules(self):
+        """Drop cached module handles so the next access re-resolves them."""
+        self._mod_cache.clear()
+        self._avail = None
+        self._flags = None
+        self._golay_probed = False
+
+    def _availability(self) -> Dict[str, bool]:
+        """Per-subsystem availability flags, computed once until `invalidate_modules`."""
+        avail = self._avail
+        if avail is None:
+            has = lambda k: self._m(k) is not None
+            avail = self._avail = {
+                "memory": has(_HM.memory),
+                "llm": has(_HM.llm_router),
+                "agent": has(_HM.agent),
+                "evo2": has(_HM.evo2),
+                "genome": has(_HM.genome),
+                "config": has(_HM.config),
+                "pipeline": has(_HM.pipeline),
+                "db": has(_HM.helixdb) or has(_HM.helixdb_git),
+                "council": has(_HM.council),
+                "repair": has(_HM.golay_repair),
+                "immune": has(_HM.immune),
+                "faction": has(_HM.faction_manager),
+                "market": has(_HM.market),
+                "revelation": has(_HM.revelation),
+            }
+        return avail
+
+    def _module_flags(self) -> Dict[str, bool]:
+        """Per-module presence flags by name, computed once until `invalidate_modules`."""
+        flags = self._flags
+        if flags is None:
+            flags = self._flags = {k.name: self._m(k) is not None for k in _HM}
+        return flags
 
     def _ensure_golay(self):
-        """Lazy probe for Golay availability."""
-        if self._golay_available:
+        """Lazy one-shot probe for Golay availability (thread-safe)."""
+        if self._golay_probed:
             return
-        mem = _get("memory")
-        if mem is not None:
-            try:
-                import numpy as np
-                test_vec = np.zeros(24, dtype=float)
-                mem.LeechErrorCorrector.correct(test_vec)
-                self._golay_available = True
-                logger.info("[HiveBridge] Golay coset table available")
-            except Exception:
-                logger.debug("[HiveBridge] Golay coset table not found — simplified Leech mode")
+        with self._golay_lock:
+            if self._golay_probed:
+                return
+            mem = self._m(_HM.memory)
+            if mem is not None:
+                try:
+                    np = _np()
+                    test_vec = np.zeros(24, dtype=float)
+                    mem.LeechErrorCorrector.correct(test_vec)
+                    self._golay_available = True
+                    logger.info("[HiveBridge] Golay coset table available")
+                except Exception:
+                    logger.debug("[HiveBridge] Golay coset table not found — simplified Leech mode")
+            self._golay_probed = True
 
     @property
     def available(self) -> bool:
         """True if core memory module loaded (minimum viable HelixHive)."""
-        return _get("memory") is not None
+        return self._availability()['memory']
 
     # ---- Tau / Jessica homeostasis ----
     def _step_tau(self):
@@ -175,68 +523,73 @@ class HiveBridge:
     # 1. LEECH LATTICE (True Golay via memory.py)
     # =====================================================================
 
-    def leech_encode(self, vec_24d: List[float]) -> np.ndarray:
+    def leech_encode(self, vec_24d: ArrayLike) -> np.ndarray:
         """Encode a 24D float vector to nearest Leech lattice point."""
-        vec = np.array(vec_24d, dtype=float)
+        np = _np()
+        vec = np.asarray(vec_24d, dtype=np.float64)  # ndarray inputs pass through uncopied
         if len(vec) != 24:
             raise ValueError(f"Leech encode requires 24D input, got {len(vec)}D")
 
         self._ensure_golay()
-        mem = _get("memory")
+        mem = self._m(_HM.memory)
         if mem is not None and self._golay_available:
             try:
                 result = mem.leech_encode(vec)
                 self._step_tau()
                 return result
             except Exception as e:
-                logger.warning(f"[HiveBridge] Golay leech_encode failed: {e}")
+                logger.warning("[HiveBridge] Golay leech_encode failed: %s", e)
                 self._decrement_j()
 
-        # Simplified fallback
-        rounded = np.round(vec).astype(int)
-        if np.sum(rounded) % 2 != 0:
-            err = vec - rounded
-            idx = np.argmax(np.abs(err))
-            rounded[idx] += 1 if err[idx] > 0 else -1
-        return rounded
+        # Simplified fallback: round, then fix odd parity on the largest residual
+        rounded = np.rint(vec)
+        err = vec - rounded
+        if int(rounded.sum()) & 1:
+            idx = int(np.abs(err).argmax())
+            rounded[idx] += 2.0 * (err[idx] > 0) - 1.0
+        return rounded.astype(np.int64)
 
-    def leech_correct(self, vec: List[float]) -> Tuple[np.ndarray, int]:
+    def leech_correct(self, vec: ArrayLike) -> Tuple[np.ndarray, int]:
         """Error-correct a 24D vector via Golay syndrome decoding."""
-        arr = np.array(vec, dtype=float)
-        mem = _get("memory")
+        np = _np()
+        arr = np.asarray(vec, dtype=np.float64)
+        mem = self._m(_HM.memory)
         if mem is not None and self._golay_available:
             try:
                 corrected, syndrome = mem.LeechErrorCorrector.correct(arr)
                 self._step_tau()
                 return corrected, int(syndrome)
             except Exception as e:
-                logger.warning(f"[HiveBridge] Golay correct failed: {e}")
+                logger.warning("[HiveBridge] Golay correct failed: %s", e)
                 self._decrement_j()
         return np.round(arr).astype(int), -1
 
-    def golay_syndrome(self, vec_24: List[int]) -> int:
+    def golay_syndrome(self, vec_24: ArrayLike) -> int:
         """Compute the 12-bit Golay syndrome of a 24-bit vector."""
-        mem = _get("memory")
+        mem = self._m(_HM.memory)
         if mem is not None and self._golay_available:
             try:
-                return mem.LeechErrorCorrector.syndrome(np.array(vec_24))
+                # asarray: ndarray inputs are not copied; syndrome() only reads them
+                return mem.LeechErrorCorrector.syndrome(_np().asarray(vec_24))
             except Exception:
                 pass
         return -1
 
     def batch_correct(self, vectors: np.ndarray) -> Tuple[np.ndarray, np.ndarray, List[Dict]]:
         """Batch error-correct multiple 24D vectors."""
-        mem = _get("memory")
+        np = _np()
+        mem = self._m(_HM.memory)
         if mem is not None and self._golay_available:
             try:
                 return mem.LeechErrorCorrector.batch_correct(vectors)
             except Exception as e:
-                logger.warning(f"[HiveBridge] batch_correct failed: {e}")
+                logger.warning("[HiveBridge] batch_correct failed: %s", e)
                 self._decrement_j()
-        # Fallback
+        # Fallback: round straight into preallocated outputs
         N = vectors.shape[0]
-        corrected = np.round(vectors).astype(int)
-        return corrected, np.full(N, -1), [{"syndrome": -1, "repaired": False}] * N
+        corrected = np.empty(vectors.shape, dtype=np.int64)
+        _round_batch(vectors, corrected)
+        return corrected, np.full(N, -1, dtype=np.int8), [{"syndrome": -1, "repaired": False} for _ in range(N)]
 
     # =====================================================================
     # 2. HD / RHC / E8 ENCODING (via memory.py)
@@ -244,103 +597,150 @@ class HiveBridge:
 
     def hd_from_word(self, word: str) -> Optional[np.ndarray]:
         """Deterministic HD vector from a word string (10000D bipolar)."""
-        mem = _get("memory")
+        mem = self._m(_HM.memory)
         if mem is not None:
             try:
                 return mem.HD.from_word(word)
             except Exception as e:
-                logger.warning(f"[HiveBridge] HD.from_word failed: {e}")
+                logger.warning("[HiveBridge] HD.from_word failed: %s", e)
         return None
 
     def hd_bundle(self, vectors: List[np.ndarray]) -> Optional[np.ndarray]:
         """Bundle multiple HD vectors via majority sum."""
-        mem = _get("memory")
+        mem = self._m(_HM.memory)
         if mem is not None:
             try:
                 return mem.HD.bundle(vectors)
             except Exception as e:
-                logger.warning(f"[HiveBridge] HD.bundle failed: {e}")
+                logger.warning("[HiveBridge] HD.bundle failed: %s", e)
         return None
 
+    def hd_bundle_packed(self, packed: np.ndarray) -> np.ndarray:
+        """
+        Majority-vote bundle of bit-packed HD vectors.
+        `packed` is (N, W) uint64, one row per vector (bit=0 ↔ +1, bit=1 ↔ -1, so
+        XOR binds); returns (W,) uint64. Ties resolve to +1, matching HD.bundle's `sum >= 0`.
+        """
+        np = _np()
+        packed = np.ascontiguousarray(packed, dtype=np.uint64)
+        if packed.ndim != 2 or packed.shape[0] == 0:
+            raise ValueError(f"hd_bundle_packed requires a non-empty (N, W) array, got {packed.shape}")
+        n = packed.shape[0]
+        counts = np.unpackbits(packed.view(np.uint8), axis=1).sum(axis=0, dtype=np.int32)
+        return np.packbits(2 * counts > n).view(np.uint64)
+
     def hd_bind(self, v1: np.ndarray, v2: np.ndarray) -> Optional[np.ndarray]:
         """Bind two HD vectors (element-wise multiplication)."""
-        mem = _get("memory")
-        if mem is not None:
-            try:
-                return mem.HD.bind(v1, v2)
-            except Exception as e:
-                logger.warning(f"[HiveBridge] HD.bind failed: {e}")
+        mem = self._m(_HM.memory)
+        if mem is None:
+            return None
+        # Fast path only for (HD.DIM,) vectors; anything else gets HD.bind's validation
+        bound = _bind_fast(v1, v2, mem.HD.DIM)
+        if bound is not None:
+            return bound
+        try:
+            return mem.HD.bind(v1, v2)
+        except Exception as e:
+            logger.warning("[HiveBridge] HD.bind failed: %s", e)
         return None
 
     def hd_similarity(self, v1: np.ndarray, v2: np.ndarray) -> Optional[float]:
         """Cosine similarity between two HD vectors."""
-        mem = _get("memory")
-        if mem is not None:
-            try:
-                return mem.HD.sim(v1, v2)
-            except Exception as e:
-                logger.warning(f"[HiveBridge] HD.sim failed: {e}")
+        mem = self._m(_HM.memory)
+        if mem is None:
+            return None
+        np = _np()
+        dim = mem.HD.DIM
+        dt1 = getattr(v1, "dtype", None)
+        dt2 = getattr(v2, "dtype", None)
+        # Fast paths only for (HD.DIM,) vectors; anything else gets HD.sim's validation
+        if dt1 == dt2 and dt1 in (np.int8, np.uint64) and v1.ndim == 1 and v1.shape == v2.shape:
+            if dt1 == np.int8 and v1.size == dim:
+                # Bipolar ±1: cosine reduces to dot / D (int32 accumulator avoids int8 wrap)
+                return float(np.dot(v1.astype(np.int32), v2.astype(np.int32))) / dim
+            if dt1 == np.uint64 and v1.size == -(-dim // 64):
+                # Bit-packed: cosine = 1 - 2 * Hamming / D (zero padding bits never differ)
+                hamming = int(np.unpackbits(np.bitwise_xor(v1, v2).view(np.uint8)).sum())
+                return 1.0 - 2.0 * hamming / dim
+        try:
+            return mem.HD.sim(v1, v2)
+        except Exception as e:
+            logger.warning("[HiveBridge] HD.sim failed: %s", e)
         return None
 
     def rhc_encode_trait(self, value: float) -> Optional[np.ndarray]:
         """Encode a trait value (0-1) using Residue Hyperdimensional Computing."""
-        mem = _get("memory")
+        mem = self._m(_HM.memory)
         if mem is not None:
             try:
                 return mem.rhc_encode(value)
             except Exception as e:
-                logger.warning(f"[HiveBridge] rhc_encode failed: {e}")
+                logger.warning("[HiveBridge] rhc_encode failed: %s", e)
         return None
 
     def rhc_bind(self, v1: np.ndarray, v2: np.ndarray) -> Optional[np.ndarray]:
         """Bind two RHC vectors."""
-        mem = _get("memory")
+        bound = _bind_fast(v1, v2)
+        if bound is not None:
+            return bound
+        mem = self._m(_HM.memory)
         if mem is not None:
             try:
                 return mem.rhc_bind(v1, v2)
             except Exception as e:
-                logger.warning(f"[HiveBridge] rhc_bind failed: {e}")
+                logger.warning("[HiveBridge] rhc_bind failed: %s", e)
         return None
 
-    def e8_closest_point(self, vec_8d: List[float]) -> Optional[np.ndarray]:
+    def e8_closest_point(self, vec_8d: ArrayLike) -> Optional[np.ndarray]:
         """Find closest E8 lattice point (integer/half-integer decoding)."""
-        mem = _get("memory")
+        np = _np()
+        vec = np.asarray(vec_8d, dtype=np.float64)
+        mem = self._m(_HM.memory)
         if mem is not None:
             try:
-                return mem.E8.closest_point(np.array(vec_8d, dtype=float))
+                return mem.E8.closest_point(vec)
             except Exception as e:
-                logger.warning(f"[HiveBridge] E8.closest_point failed: {e}")
-        return None
+                logger.warning("[HiveBridge] E8.closest_point failed: %s", e)
+            return None
+        # Native fallback when memory.py is unavailable
+        if vec.shape != (8,):
+            logger.warning("[HiveBridge] E8 fallback requires 8D input, got %s", vec.shape)
+            return None
+        return _e8_closest(vec)
 
     # =====================================================================
     # 3. LLM ROUTING (Groq → OpenRouter → Grok)
     # =====================================================================
 
     def call_llm_sync(self, prompt: str, system: Optional[str] = None,
-                      temperature: float = 0.7, max_tokens: int = 1000) -> Optional[str]:
+                      temperature: float = 0.7, max_tokens: int = 1000,
+                      timeout: Optional[float] = None) -> Optional[str]:
         """Synchronous wrapper around HelixHive's async LLM router."""
-        llm = _get("llm_router")
+        import asyncio
+        llm = self._m(_HM.llm_router)
         if llm is None:
             return None
         try:
-            loop = asyncio.new_event_loop()
+            fut = asyncio.run_coroutine_threadsafe(
+                llm.call_llm(prompt=prompt, system=system,
+                             temperature=temperature, max_tokens=max_tokens),
+                _ensure_bg_loop(),
+            )
             try:
-                result = loop.run_until_complete(
-                    llm.call_llm(prompt=prompt, system=system,
-                                 temperature=temperature, max_tokens=max_tokens)
-                )
-                self._step_tau()
-                return result
-            finally:
-                loop.close()
+                result = fut.result(timeout=timeout)
+            except BaseException:
+                fut.cancel()
+                raise
+            self._step_tau()
+            return result
         except Exception as e:
-            logger.warning(f"[HiveBridge] LLM router call failed: {e}")
+            logger.warning("[HiveBridge] LLM router call failed: %s", e)
             self._decrement_j()
             return None
 
     @property
     def llm_available(self) -> bool:
-        return _get("llm_router") is not None
+        return self._availability()['llm']
 
     # =====================================================================
     # 4. AGENT MANAGEMENT (agent.py + evo2.py)
@@ -349,7 +749,7 @@ class HiveBridge:
     async def call_llm(self, prompt: str, system: Optional[str] = None,
                        temperature: float = 0.7, max_tokens: int = 1000) -> Optional[str]:
         """Asynchronous call to HelixHive's LLM router."""
-        llm = _get("llm_router")
+        llm = self._m(_HM.llm_router)
         if llm is None:
             return None
         try:
@@ -358,14 +758,27 @@ class HiveBridge:
             self._step_tau()
             return result
         except Exception as e:
-            logger.warning(f"[HiveBridge] LLM router call failed: {e}")
+            logger.warning("[HiveBridge] LLM router call failed: %s", e)
             self._decrement_j()
             return None
 
+    async def call_llm_batch(self, prompts: List[str], system: Optional[str] = None,
+                             temperature: float = 0.7, max_tokens: int = 1000) -> List[Optional[str]]:
+        """
+        Send several prompts to the LLM router concurrently.
+        Returns one response per prompt, in order; None where a call failed.
+        """
+        import asyncio
+        if self._m(_HM.llm_router) is None:
+            return [None] * len(prompts)
+        return list(await asyncio.gather(*(
+            self.call_llm(p, system=system, temperature=temperature, max_tokens=max_tokens)
+            for p in prompts)))
+
     def create_agent(self, role: str, prompt: str,
                      traits: Optional[Dict[str, float]] = None) -> Optional[Dict]:
         """Create a HelixHive Agent with Leech-encoded traits."""
-        agent_mod = _get("agent")
+        agent_mod = self._m(_HM.agent)
         if agent_mod is None:
             return None
         try:
@@ -380,38 +793,41 @@ class HiveBridge:
                 "generation": agent.generation,
             }
         except Exception as e:
-            logger.warning(f"[HiveBridge] create_agent failed: {e}")
+            logger.warning("[HiveBridge] create_agent failed: %s", e)
             self._decrement_j()
             return None
 
     def mutate_agent_traits(self, traits: Dict[str, float],
                             mutation_rate: float = 0.1) -> Dict[str, float]:
         """Apply Gaussian mutation to trait values (standalone, no Agent needed)."""
-        mutated = {}
-        for k, v in traits.items():
-            noise = np.random.normal(0, mutation_rate)
-            mutated[k] = max(0.0, min(1.0, v + noise))
-        return mutated
+        np = _np()
+        if self._rng is None:
+            self._rng = np.random.default_rng()
+        keys = list(traits)
+        vals = np.fromiter((traits[k] for k in keys), dtype=np.float64, count=len(keys))
+        vals += self._rng.normal(0.0, mutation_rate, size=vals.size)
+        np.clip(vals, 0.0, 1.0, out=vals)
+        return dict(zip(keys, vals.tolist()))
 
     def generate_synthetic_genome(self, context: Dict[str, Any]) -> Optional[Dict]:
         """Generate a novel agent genome via Evo2 (requires DB + genome)."""
-        evo2 = _get("evo2")
+        evo2 = self._m(_HM.evo2)
         if evo2 is None:
             return None
         try:
             return {"available": True, "engine": "Evo2Generator",
                     "note": "Full generation requires HelixDBGit + genome.yaml wiring"}
         except Exception as e:
-            logger.warning(f"[HiveBridge] Evo2 generation failed: {e}")
+            logger.warning("[HiveBridge] Evo2 generation failed: %s", e)
             return None
 
     @property
     def agent_available(self) -> bool:
-        return _get("agent") is not None
+        return self._availability()['agent']
 
     @property
     def evo2_available(self) -> bool:
-        return _get("evo2") is not None
+        return self._availability()['evo2']
 
     # =====================================================================
     # 5. GENOME & CONFIG (genome.py + config.py)
@@ -419,19 +835,19 @@ class HiveBridge:
 
     def load_genome(self) -> Optional[Dict]:
         """Load the HelixHive genome YAML configuration."""
-        genome_mod = _get("genome")
+        genome_mod = self._m(_HM.genome)
         if genome_mod is None:
             return None
         try:
             genome = genome_mod.Genome()
             return genome.data
         except Exception as e:
-            logger.warning(f"[HiveBridge] Genome load failed: {e}")
+            logger.warning("[HiveBridge] Genome load failed: %s", e)
             return None
 
     def get_genome_defaults(self) -> Optional[Dict]:
         """Get default genome values (no file required)."""
-        genome_mod = _get("genome")
+        genome_mod = self._m(_HM.genome)
         if genome_mod is None:
             return None
         try:
@@ -439,23 +855,28 @@ class HiveBridge:
         except Exception:
             return None
 
-    def load_config(self) -> Optional[Dict]:
-        """Load the HelixHive deployment configuration."""
-        config_mod = _get("config")
+    def load_config(self, force_reload: bool = False) -> Optional[Dict]:
+        """
+        Load the HelixHive deployment configuration.
+
+        Returns the Config singleton's data; pass force_reload=True to discard
+        the singleton and re-read config.yaml (previously every call reloaded).
+        """
+        config_mod = self._m(_HM.config)
         if config_mod is None:
             return None
         try:
-            # Reset singleton for clean load
-            config_mod.Config._instance = None
+            if force_reload:
+                config_mod.Config._instance = None
             cfg = config_mod.Config()
             return cfg.data
         except Exception as e:
-            logger.warning(f"[HiveBridge] Config load failed: {e}")
+            logger.warning("[HiveBridge] Config load failed: %s", e)
             return None
 
     def get_config_defaults(self) -> Optional[Dict]:
         """Get default config values (no file required)."""
-        config_mod = _get("config")
+        config_mod = self._m(_HM.config)
         if config_mod is None:
             return None
         try:
@@ -465,117 +886,73 @@ class HiveBridge:
 
     @property
     def genome_available(self) -> bool:
-        return _get("genome") is not None
+        return self._availability()['genome']
 
     @property
     def config_available(self) -> bool:
-        return _get("config") is not None
+        return self._availability()['config']
 
     # =====================================================================
     # 6. PIPELINE (4-round product creation)
     # =====================================================================
 
-    def get_pipeline_info(self) -> Optional[Dict]:
-        """Get information about the product pipeline."""
-        pipeline_mod = _get("pipeline")
+    def get_pipeline_info(self) -> Optional[Mapping[str, Any]]:
+        """Get information about the product pipeline (read-only mapping)."""
+        pipeline_mod = self._m(_HM.pipeline)
         if pipeline_mod is None:
             return None
         try:
-            pp = pipeline_mod.ProductPipeline
-            return {
-                "available": True,
-                "class": "ProductPipeline",
-                "rounds": 4,
-                "round_prompts": list(pp.ROUND_PROMPTS.keys()) if hasattr(pp, 'ROUND_PROMPTS') else [],
-                "note": "Full pipeline requires HelixDBGit + genome + config"
-            }
+            return _pipeline_info_for(pipeline_mod.ProductPipeline)
         except Exception as e:
-            logger.warning(f"[HiveBridge] Pipeline info failed: {e}")
+            logger.warning("[HiveBridge] Pipeline info failed: %s", e)
             return None
 
     @property
     def pipeline_available(self) -> bool:
-        return _get("pipeline") is not None
+        return self._availability()['pipeline']
 
     # =====================================================================
     # 7. DATABASE (helixdb.py + helixdb_git_adapter.py)
     # =====================================================================
 
-    def get_db_info(self) -> Optional[Dict]:
-        """Get information about the database modules."""
-        db = _get("helixdb")
-        git = _get("helixdb_git")
-        return {
-            "helixdb_available": db is not None,
-            "helixdb_git_available": git is not None,
-            "node_types": git.HelixDBGit.NODE_TYPES if git and hasattr(git.HelixDBGit, 'NODE_TYPES') else [],
-            "capabilities": {
-                "graph_queries": db is not None,
-                "vector_search": db is not None,
-                "git_backed": git is not None,
-                "git_lfs": git is not None,
-            }
-        }
+    def get_db_info(self) -> Mapping[str, Any]:
+        """Get information about the database modules (read-only mapping)."""
+        db = self._m(_HM.helixdb)
+        git = self._m(_HM.helixdb_git)
+        return _db_info_for(db is not None, git is not None, _node_types(git))
 
     @property
     def db_available(self) -> bool:
-        return _get("helixdb") is not None or _get("helixdb_git") is not None
+        return self._availability()['db']
 
     # =====================================================================
     # 8. GOVERNANCE (council.py + proposals.py + model_proposals.py)
     # =====================================================================
 
-    def get_governance_info(self) -> Dict:
-        """Get information about the governance system."""
-        council = _get("council")
-        proposals = _get("proposals")
-        model_prop = _get("model_proposals")
-        return {
-            "council_available": council is not None,
-            "proposals_available": proposals is not None,
-            "model_proposals_available": model_prop is not None,
-            "council_members": 6 if council is not None else 0,
-            "features": {
-                "weighted_voting": council is not None,
-                "guardian_veto": council is not None,
-                "constitutional_checks": council is not None,
-                "supermajority_amend": council is not None,
-                "proposal_management": proposals is not None,
-                "daughter_repo_spawning": model_prop is not None,
-            }
-        }
+    def get_governance_info(self) -> Mapping[str, Any]:
+        """Get information about the governance system (read-only mapping)."""
+        return _governance_info_for(
+            self._m(_HM.council) is not None,
+            self._m(_HM.proposals) is not None,
+            self._m(_HM.model_proposals) is not None,
+        )
 
     @property
     def council_available(self) -> bool:
-        return _get("council") is not None
+        return self._availability()['council']
 
     # =====================================================================
     # 9. HEALTH / IMMUNE SYSTEM (immune.py + golay_self_repair_v5.py)
     # =====================================================================
 
-    def get_immune_info(self) -> Dict:
-        """Get information about the immune/health system."""
-        immune = _get("immune")
-        repair = _get("golay_repair")
-        return {
-            "immune_available": immune is not None,
-            "golay_repair_available": repair is not None,
-            "capabilities": {
-                "failure_detection": immune is not None,
-                "anomaly_detection": immune is not None,
-                "healing_proposals": immune is not None,
-                "codebase_self_repair": repair is not None,
-                "vigil_fsm": repair is not None,
-                "syntax_repair": repair is not None,
-                "ruff_integration": repair is not None,
-                "bandit_security": repair is not None,
-            }
-        }
+    def get_immune_info(self) -> Mapping[str, Any]:
+        """Get information about the immune/health system (read-only mapping)."""
+        return _immune_info_for(self._m(_HM.immune) is not None, self._m(_HM.golay_repair) is not None)
 
     def run_self_repair(self, root_dir: Optional[str] = None,
                         dry_run: bool = True) -> Optional[Dict]:
         """Run Golay codebase self-repair (dry_run=True for safety)."""
-        repair_mod = _get("golay_repair")
+        repair_mod = self._m(_HM.golay_repair)
         if repair_mod is None:
             return None
         target_dir = root_dir or str(Path(__file__).resolve().parent.parent)
@@ -585,46 +962,33 @@ class HiveBridge:
             self._step_tau()
             return result
         except Exception as e:
-            logger.warning(f"[HiveBridge] Self-repair failed: {e}")
+            logger.warning("[HiveBridge] Self-repair failed: %s", e)
             self._decrement_j()
             return None
 
     @property
     def repair_available(self) -> bool:
-        return _get("golay_repair") is not None
+        return self._availability()['repair']
 
     @property
     def immune_available(self) -> bool:
-        return _get("immune") is not None
+        return self._availability()['immune']
 
     # =====================================================================
     # 10. SOCIAL (faction_manager.py + market.py)
     # =====================================================================
 
-    def get_social_info(self) -> Dict:
-        """Get information about faction/market subsystems."""
-        faction = _get("faction_manager")
-        market = _get("market")
-        return {
-            "faction_manager_available": faction is not None,
-            "market_available": market is not None,
-            "capabilities": {
-                "dbscan_clustering": faction is not None,
-                "faction_centroids": faction is not None,
-                "niche_matching": faction is not None,
-                "trait_listings": market is not None,
-                "auctions": market is not None,
-                "reputation_transfer": market is not None,
-            }
-        }
+    def get_social_info(self) -> Mapping[str, Any]:
+        """Get information about faction/market subsystems (read-only mapping)."""
+        return _social_info_for(self._m(_HM.faction_manager) is not None, self._m(_HM.market) is not None)
 
     @property
     def faction_available(self) -> bool:
-        return _get("faction_manager") is not None
+        return self._availability()['faction']
 
     @property
     def market_available(self) -> bool:
-        return _get("market") is not None
+        return self._availability()['market']
 
     # =====================================================================
     # 11. REVELATION ENGINE
@@ -632,7 +996,7 @@ class HiveBridge:
 
     def get_revelation_info(self) -> Optional[Dict]:
         """Get information about the Revelation Engine."""
-        rev = _get("revelation")
+        rev = self._m(_HM.revelation)
         if rev is None:
             return None
         return {
@@ -644,7 +1008,7 @@ class HiveBridge:
 
     def generate_revelation(self, context: Dict[str, Any]) -> Optional[Dict]:
         """Proxy for revelation generation."""
-        rev = _get("revelation")
+        rev = self._m(_HM.revelation)
         if rev is None:
             return None
         return {
@@ -655,84 +1019,94 @@ class HiveBridge:
 
     @property
     def revelation_available(self) -> bool:
-        return _get("revelation") is not None
+        return self._availability()['revelation']
 
     # =====================================================================
     # 12. ECOSYSTEM (orchestrator, marketplace_sync, user_requests, etc.)
     # =====================================================================
 
-    def get_ecosystem_info(self) -> Dict:
-        """Get information about all ecosystem modules."""
-        return {
-            "orchestrator_available": _get("orchestrator") is not None,
-            "marketplace_sync_available": _get("marketplace_sync") is not None,
-            "user_requests_available": _get("user_requests") is not None,
-            "world_model_available": _get("world_model") is not None,
-            "fitness_available": _get("fitness") is not None,
-            "resources_available": _get("resources") is not None,
-            "helical_available": _get("helical") is not None,
-        }
+    def get_ecosystem_info(self) -> Mapping[str, Any]:
+        """Get information about all ecosystem modules (read-only mapping)."""
+        m = self._m
+        return _ecosystem_info_for(
+            m(_HM.orchestrator) is not None, m(_HM.marketplace_sync) is not None,
+            m(_HM.user_requests) is not None, m(_HM.world_model) is not None,
+            m(_HM.fitness) is not None, m(_HM.resources) is not None,
+            m(_HM.helical) is not None,
+        )
 
     # =====================================================================
     # 13. FULL SYSTEM DIAGNOSTICS
     # =====================================================================
 
     def get_state(self) -> Dict[str, Any]:
-        """Full diagnostic state — every module's availability."""
+        """Full diagnostic state — every module's availability.
+
+        Built fresh on each call from the cached module flags, so callers
+        may modify the result freely.
+        """
+        has = self._module_flags()
         return {
-            "available": self.available,
+            "available": has["memory"],
             "golay_available": self._golay_available,
             "tau": round(self.tau, 4),
             "J": round(self.J, 4),
             "modules_loaded": sum(1 for v in _modules.values() if v is not None),
             "modules_total": len(_modules),
+            "modules": dict(has),
             "core_math": {
-                "memory": _get("memory") is not None,
-                "helical": _get("helical") is not None,
+                "memory": has["memory"],
+                "helical": has["helical"],
             },
             "llm": {
-                "llm_router": self.llm_available,
+                "llm_router": has["llm_router"],
             },
             "agents": {
-                "agent": self.agent_available,
-                "evo2": self.evo2_available,
+                "agent": has["agent"],
+                "evo2": has["evo2"],
             },
             "config": {
-                "genome": self.genome_available,
-                "config": self.config_available,
+                "genome": has["genome"],
+                "config": has["config"],
             },
             "pipeline": {
-                "pipeline": self.pipeline_available,
+                "pipeline": has["pipeline"],
             },
-            "database": self.get_db_info(),
-            "governance": self.get_governance_info(),
-            "health": self.get_immune_info(),
-            "social": self.get_social_info(),
+            "database": _db_info(
+                has["helixdb"], has["helixdb_git"], _node_types(self._m(_HM.helixdb_git))),
+            "governance": _governance_info(has["council"], has["proposals"], has["model_proposals"]),
+            "health": _immune_info(has["immune"], has["golay_repair"]),
+            "social": _social_info(has["faction_manager"], has["market"]),
             "discovery": {
-                "revelation": self.revelation_available,
+                "revelation": has["revelation"],
             },
-            "ecosystem": self.get_ecosystem_info(),
+            "ecosystem": _ecosystem_info(
+                has["orchestrator"], has["marketplace_sync"], has["user_requests"],
+                has["world_model"], has["fitness"], has["resources"], has["helical"]),
         }
 
     def get_summary(self) -> str:
         """Human-readable summary of HiveBridge status."""
+        # Straight from the cached availability flags instead of re-probing each module
+        a = self._availability()
+        mark = lambda k: '✓' if a[k] else '✗'
         loaded = sum(1 for v in _modules.values() if v is not None)
         total = len(_modules)
         lines = [
             f"HiveBridge: {loaded}/{total} modules loaded",
             f"  Golay Leech: {'✓' if self._golay_available else '✗ (simplified mode)'}",
-            f"  LLM Router:  {'✓ Groq/OpenRouter/Grok' if self.llm_available else '✗ (Ollama fallback)'}",
-            f"  Agents:      {'✓' if self.agent_available else '✗'}",
-            f"  Evo2:        {'✓' if self.evo2_available else '✗'}",
-            f"  Genome:      {'✓' if self.genome_available else '✗'}",
-            f"  Pipeline:    {'✓' if self.pipeline_available else '✗'}",
-            f"  Council:     {'✓' if self.council_available else '✗'}",
-            f"  Immune:      {'✓' if self.immune_available else '✗'}",
-            f"  Revelation:  {'✓' if self.revelation_available else '✗'}",
-            f"  Factions:    {'✓' if self.faction_available else '✗'}",
-            f"  Market:      {'✓' if self.market_available else '✗'}",
-            f"  Self-Repair: {'✓' if self.repair_available else '✗'}",
-            f"  Database:    {'✓' if self.db_available else '✗'}",
+            f"  LLM Router:  {'✓ Groq/OpenRouter/Grok' if a['llm'] else '✗ (Ollama fallback)'}",
+            f"  Agents:      {mark('agent')}",
+            f"  Evo2:        {mark('evo2')}",
+            f"  Genome:      {mark('genome')}",
+            f"  Pipeline:    {mark('pipeline')}",
+            f"  Council:     {mark('council')}",
+            f"  Immune:      {mark('immune')}",
+            f"  Revelation:  {mark('revelation')}",
+            f"  Factions:    {mark('faction')}",
+            f"  Market:      {mark('market')}",
+            f"  Self-Repair: {mark('repair')}",
+            f"  Database:    {mark('db')}",
             f"  τ={self.tau:.4f}  J={self.J:.4f}",
         ]
         return "\n".join(lines)
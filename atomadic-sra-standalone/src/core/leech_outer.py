@@ -1,6 +1,14 @@
+import functools
 import math
 import time
 
+import numpy as np
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:  # optional: spatial index for large concept spaces
+    cKDTree = None
+
 # --- Rule 10: Helical Derivation for Leech Quantization ---
 # Principle: Concepts projected to 24D densest packing.
 # Derivation: Quantization snaps to nearest lattice point Lambda_24.
@@ -8,6 +16,99 @@ import time
 # Audit: tau = 1.0, J = 0.99.
 # -----------------------------------------------------------
 
+# Per-position projection weights 0.01 + 0.002·sin(0.1·i), computed once for typical text lengths
+_SIN_WEIGHTS_LEN = 8192
+_SIN_WEIGHTS = 0.01 + 0.002 * np.sin(np.arange(_SIN_WEIGHTS_LEN) * 0.1)
+
+
+def _sin_weights(n):
+    """First `n` projection weights; only texts longer than the table pay for sin()."""
+    if n <= _SIN_WEIGHTS_LEN:
+        return _SIN_WEIGHTS[:n]
+    return 0.01 + 0.002 * np.sin(np.arange(n) * 0.1)
+
+
+def _quantize_half(v):
+    """Round to the nearest 0.5 (ties to even, as round() does); -0.0 is folded to 0.0."""
+    out = np.rint(v * 2)
+    out *= 0.5
+    out += 0.0
+    return out
+
+
+def _row_norms(M):
+    """Euclidean norm of each row of an (N, D) array."""
+    return np.sqrt(np.einsum("ij,ij->i", M, M))
+
+
+def _euclid_to(M, q):
+    """Euclidean distance from `q` to every row of `M`."""
+    return _row_norms(M - q)
+
+
+def _norm(v):
+    """L2 norm of one 1-D vector; same value as np.linalg.norm without its generic dispatch."""
+    return math.sqrt(v @ v)
+
+
+_DIMENSION = 24
+
+
+@functools.lru_cache(maxsize=8192)
+def _project_text(text):
+    """Unit 24-D embedding of `text` (rounded to 6 places), memoized as an immutable tuple."""
+    # Code points of the text (ord per char, lone surrogates included) without a Python-level loop
+    codes = np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+    n = codes.size
+    contrib = codes * _sin_weights(n)
+    # Fold char i onto dim i % 24: pad to whole rows of 24 and sum down the columns
+    rows = -(-n // _DIMENSION)
+    padded = np.zeros(rows * _DIMENSION)
+    padded[:n] = contrib
+    vector = padded.reshape(rows, _DIMENSION).sum(axis=0)
+
+    norm = _norm(vector) or 1
+    return tuple(np.round(vector / norm, 6).tolist())
+
+
+_TRACE_CHUNK = 1024  # trace-vector rows allocated per growth step
+_TOP_K = 5  # neighbours reported per explored concept
+_NEIGHBOR_RADIUS = 0.5
+_KDTREE_MIN = 10000  # below this a BLAS scan beats building a tree at d=24
+_NN_REBUILD_MIN = 256  # rows appended after a fit that are scanned directly before refitting
+
+
+class _BruteNN:
+    """Exact radius search by scanning every fitted row."""
+
+    def fit(self, M):
+        self.rows = len(M)
+        self._M = M
+        return self
+
+    def query(self, q, radius):
+        """Ascending row indices strictly within `radius` of `q`, with their distances."""
+        d = _euclid_to(self._M, q)
+        idx = np.flatnonzero(d < radius)
+        return idx, d[idx]
+
+
+class _KDTreeNN(_BruteNN):
+    """cKDTree candidate search; distances are re-measured so results match _BruteNN."""
+
+    def fit(self, M):
+        super().fit(M)
+        self._tree = cKDTree(M)
+        return self
+
+    def query(self, q, radius):
+        # Slightly wider ball so float disagreement at the boundary cannot drop a row
+        idx = np.sort(np.asarray(self._tree.query_ball_point(q, radius * (1 + 1e-9)), dtype=np.intp))
+        d = _euclid_to(self._M[idx], q)
+        keep = d < radius
+        return idx[keep], d[keep]
+
+
 class LeechOuter:
     """
     Leech Outer Layer (24D) | SRA-HelixEvolver v4.4.0
@@ -18,13 +119,23 @@ class LeechOuter:
     Concepts are projected into 24D space for exploration and creative reasoning.
     Traces are compressed via spherical quantization.
     """
-    DIMENSION = 24
+    DIMENSION = _DIMENSION
     KISS_NUMBER = 196560
 
     def __init__(self):
         self.reasoning_traces = []
         self.concept_space = {}
         self.exploration_frontier = []
+        # Row-per-concept mirror of concept_space for batched distance math
+        self._concept_matrix = np.empty((64, self.DIMENSION))
+        self._concept_ids = []
+        self._concept_rows = {}
+        self._concept_norms = np.empty(64)  # L2 norm per row, taken once on insert
+        # SoA mirror of reasoning_traces[*]["vector"]: scans never touch the trace dicts
+        self._trace_vectors = np.empty((_TRACE_CHUNK, self.DIMENSION))
+        self._trace_count = 0
+        # Radius-search index over a prefix of _concept_matrix; rebuilt lazily
+        self._nn_backend = None
 
     def explore(self, concept):
         """Explore a concept in 24D space. Returns a compressed trace."""
@@ -40,6 +151,8 @@ class LeechOuter:
         
         self.reasoning_traces.append(trace)
         self.concept_space[concept] = vector
+        self._store_concept(concept, vector)
+        self._store_trace_vector(vector)
         
         print(f"[Leech] Explored: {concept} -> {trace['id']} ({len(trace['neighbors'])} neighbors)")
         return trace
@@ -54,28 +167,53 @@ class LeechOuter:
         else:
             vector = self._project_to_24d(str(trace))
             
+        v = np.asarray(vector, dtype=float)
         # Quantize: round each component to nearest 0.5 (simplified Leech quantization)
-        quantized = [round(v * 2) / 2 for v in vector]
-        
+        quantized = _quantize_half(v)
+
         # Trace pruning simulation: only keep points with high energy
-        energy = sum(v**2 for v in vector)**0.5
+        energy = _norm(v)
         is_significant = energy > 0.05
-        
+
         return {
             "original_dim": self.DIMENSION,
-            "quantized_vector": quantized if is_significant else [0.0] * self.DIMENSION,
+            "quantized_vector": quantized.tolist() if is_significant else [0.0] * self.DIMENSION,
             "compression_ratio": 0.5 if is_significant else 0.0,
             "is_significant": is_significant,
-            "fidelity": round(1.0 - self._vector_distance(vector, quantized), 4)
+            "fidelity": round(1.0 - _norm(v - quantized), 4)
         }
 
+    def compress_all_traces(self):
+        """Batch compress_trace over every explored trace, computed on the trace-vector matrix."""
+        vectors = self.trace_vectors
+        quantized = self.align_batch(vectors)
+        energy = _row_norms(vectors)
+        fidelity = 1.0 - _euclid_to(vectors, quantized)
+        zeros = [0.0] * self.DIMENSION
+        return [
+            {
+                "original_dim": self.DIMENSION,
+                "quantized_vector": q if sig else zeros,
+                "compression_ratio": 0.5 if sig else 0.0,
+                "is_significant": sig,
+                "fidelity": round(f, 4),
+            }
+            for q, sig, f in zip(quantized.tolist(), (energy > 0.05).tolist(), fidelity.tolist())
+        ]
+
+    @property
+    def trace_vectors(self):
+        """Read-only (N, 24) view of all explored trace vectors, in trace order."""
+        view = self._trace_vectors[:self._trace_count]
+        view.flags.writeable = False
+        return view
+
     def fusion_isometry(self, e8_vector: list, leech_vector: list):
         """
         Deep Leech Fusion Isometry (Φ)
         Helix v4.4.0: Maps 8D logic state to 24D creativity space via isometric projection.
         s_f = sum(alpha_i * Φ(m_i))
         """
-        import numpy as np
         v8 = np.array(e8_vector)
         v24 = np.array(leech_vector)
         
@@ -96,56 +234,112 @@ class LeechOuter:
     def align_to_lattice(self, vector: list):
         """Snaps a mutant vector back to the nearest Leech lattice point Lambda_24."""
         # Quantization snaps to nearest 0.5 grid (simplification of Lambda_24)
-        aligned = [round(v * 2) / 2 for v in vector]
-        return aligned
+        return _quantize_half(np.asarray(vector, dtype=float)).tolist()
+
+    def align_batch(self, M):
+        """align_to_lattice for an (N, 24) batch; returns a new array."""
+        return _quantize_half(np.asarray(M, dtype=float))
 
     def find_creative_connections(self, concept_a, concept_b):
         """
         Find creative connections between two concepts via their 24D representations.
         The angular distance in 24D reveals non-obvious semantic relationships.
         """
-        vec_a = self.concept_space.get(concept_a, self._project_to_24d(concept_a))
-        vec_b = self.concept_space.get(concept_b, self._project_to_24d(concept_b))
-        
-        dot = sum(a * b for a, b in zip(vec_a, vec_b))
-        norm_a = math.sqrt(sum(a**2 for a in vec_a)) or 1
-        norm_b = math.sqrt(sum(b**2 for b in vec_b)) or 1
-        
-        cosine_sim = dot / (norm_a * norm_b)
+        vec_a, norm_a = self._concept_vector(concept_a)
+        vec_b, norm_b = self._concept_vector(concept_b)
+
+        cosine_sim = float(vec_a @ vec_b) / (norm_a * norm_b)
         angle = math.acos(max(-1, min(1, cosine_sim)))
-        
+
         # Midpoint in 24D = the "bridge concept"
-        midpoint = [(a + b) / 2 for a, b in zip(vec_a, vec_b)]
-        
+        midpoint = (vec_a[:4] + vec_b[:4]) / 2
+
         return {
             "similarity": round(cosine_sim, 4),
             "angle_radians": round(angle, 4),
             "connection_strength": round(1.0 - angle / math.pi, 4),
-            "bridge_vector": [round(v, 4) for v in midpoint[:4]]  # Show first 4 dims
+            "bridge_vector": [round(v, 4) for v in midpoint.tolist()]  # Show first 4 dims
         }
 
     def _project_to_24d(self, text):
         """Project text to 24D using hash-based embedding."""
-        vector = [0.0] * self.DIMENSION
-        for i, char in enumerate(text):
-            idx = i % self.DIMENSION
-            vector[idx] += ord(char) * (0.01 + 0.002 * math.sin(i * 0.1))
-        
-        norm = math.sqrt(sum(v**2 for v in vector)) or 1
-        return [round(v / norm, 6) for v in vector]
+        return list(_project_text(text))
+
+    def _store_concept(self, concept, vector):
+        """Write a concept's vector into the matrix mirror, growing it geometrically."""
+        row = self._concept_rows.get(concept)
+        if row is None:
+            row = len(self._concept_ids)
+            if row == self._concept_matrix.shape[0]:
+                grown = np.empty((2 * row, self.DIMENSION))
+                grown[:row] = self._concept_matrix
+                self._concept_matrix = grown
+                self._concept_norms = np.resize(self._concept_norms, 2 * row)
+            self._concept_rows[concept] = row
+            self._concept_ids.append(concept)
+        elif self._nn_backend is not None and row < self._nn_backend.rows:
+            self._nn_backend = None  # a fitted row moved
+        self._concept_matrix[row] = vector
+        v = self._concept_matrix[row]
+        self._concept_norms[row] = _norm(v) or 1
+
+    def _concept_vector(self, concept):
+        """Vector and L2 norm of a concept; unexplored concepts are projected on the fly."""
+        row = self._concept_rows.get(concept)
+        if row is not None:
+            return self._concept_matrix[row], float(self._concept_norms[row])
+        vec = np.asarray(self._project_to_24d(concept))
+        return vec, _norm(vec) or 1
+
+    def _store_trace_vector(self, vector):
+        """Append a trace vector, growing the matrix a chunk at a time."""
+        row = self._trace_count
+        if row == self._trace_vectors.shape[0]:
+            grown = np.empty((row + _TRACE_CHUNK, self.DIMENSION))
+            grown[:row] = self._trace_vectors
+            self._trace_vectors = grown
+        self._trace_vectors[row] = vector
+        self._trace_count = row + 1
+
+    def _nn_index(self, n):
+        """Current neighbour index, refitted once too many rows sit outside it."""
+        nn = self._nn_backend
+        if nn is None or n - nn.rows > max(_NN_REBUILD_MIN, nn.rows // 4):
+            cls = _KDTreeNN if cKDTree is not None and n >= _KDTREE_MIN else _BruteNN
+            nn = self._nn_backend = cls().fit(self._concept_matrix[:n])
+        return nn
 
     def _find_neighbors(self, vector):
         """Find concepts nearest to a given vector."""
-        neighbors = []
-        for concept, vec in self.concept_space.items():
-            dist = self._vector_distance(vector, vec)
-            if dist < 0.5 and dist > 0:
-                neighbors.append({"concept": concept, "distance": round(dist, 4)})
-        return sorted(neighbors, key=lambda x: x["distance"])[:5]
+        n = len(self._concept_ids)
+        if n == 0:
+            return []
+        q = np.asarray(vector, dtype=float)
+        nn = self._nn_index(n)
+        cand, dists = nn.query(q, _NEIGHBOR_RADIUS)
+        if nn.rows < n:
+            # Concepts explored since the last fit are scanned directly
+            tail, tail_d = _BruteNN().fit(self._concept_matrix[nn.rows:n]).query(q, _NEIGHBOR_RADIUS)
+            cand = np.concatenate((cand, tail + nn.rows))
+            dists = np.concatenate((dists, tail_d))
+        nonzero = dists > 0
+        cand, dists = cand[nonzero], dists[nonzero]
+        rounded = np.round(dists, 4)
+        if cand.size > _TOP_K:
+            # O(N) partial select of the k-th distance; keeping every tie with it
+            # lets the small stable sort below preserve insertion order.
+            kth = np.partition(rounded, _TOP_K - 1)[_TOP_K - 1]
+            keep = np.flatnonzero(rounded <= kth)
+            cand, dists, rounded = cand[keep], dists[keep], rounded[keep]
+        # Stable sort keeps insertion order among equal distances
+        order = np.argsort(rounded, kind="stable")[:_TOP_K]
+        return [{"concept": self._concept_ids[cand[i]], "distance": round(float(dists[i]), 4)} for i in order]
 
     def _vector_distance(self, v1, v2):
         """Standard Euclidean distance optimized for 24D."""
-        return sum((a - b)**2 for a, b in zip(v1, v2))**0.5
+        # math.dist runs in C; slicing keeps zip()'s shortest-length semantics
+        n = min(len(v1), len(v2))
+        return math.dist(v1[:n], v2[:n])
 
     def get_stats(self):
         return {
@@ -1,6 +1,19 @@
 import time
 from typing import Dict, Any, List
 
+
+def _mentions_lattice(item: Any) -> bool:
+    text = str(item).lower()
+    return "e8" in text or "leech" in text
+
+
+_ABSTRACT_TMPL = (
+    "Grant Abstract (v8.0): The manifestation of {innovation} using the SRA-Helix v8.0 Omega substrate. "
+    "Grounding in Leech lattice (Λ₂₄) ensures universal optimality as per Cohn-Kumar (2022). "
+    "This tensor-based approach follows Craddock 2022 guidelines for robust IP protection in the BC tech ecosystem."
+).format
+
+
 class LegalIPAudit:
     """
     Legal IP Audit & Valuation (v7.0)
@@ -15,8 +28,8 @@ class LegalIPAudit:
         """Provides a formal valuation score and patent-readiness audit."""
         score = 0.95 # Base score for Helix v7.0 manifests
         
-        # Check for lattice grounding
-        if "e8" in str(project_manifest).lower() or "leech" in str(project_manifest).lower():
+        # Check for lattice grounding field by field; stops at the first hit
+        if any(_mentions_lattice(k) or _mentions_lattice(v) for k, v in project_manifest.items()):
             score += 0.04
             
         return {
@@ -30,18 +43,11 @@ class LegalIPAudit:
 
     def generate_grant_abstract(self, innovation: str):
         """Generates a Vancouver-timed grant abstract for BC-based funding."""
-        return (
-            f"Grant Abstract (v8.0): The manifestation of {innovation} using the SRA-Helix v8.0 Omega substrate. "
-            f"Grounding in Leech lattice (Λ₂₄) ensures universal optimality as per Cohn-Kumar (2022). "
-            f"This tensor-based approach follows Craddock 2022 guidelines for robust IP protection in the BC tech ecosystem."
-        )
+        return _ABSTRACT_TMPL(innovation=innovation)
 
     def generate_grant_swarm(self, projects: List[str]) -> List[str]:
         """Axiom IV: Automating the grant-swarm for Vancouver Q2 2026."""
-        swarm = []
-        for p in projects:
-            swarm.append(self.generate_grant_abstract(p))
-        return swarm
+        return [_ABSTRACT_TMPL(innovation=p) for p in projects]
 
 if __name__ == "__main__":
     audit = LegalIPAudit()
@@ -1,6 +1,9 @@
 
 import time
-import json
+
+import numpy as np
+
+_INITIAL_SLOTS = 16
 
 class MLHub:
     """
@@ -13,7 +16,12 @@ class MLHub:
     """
     def __init__(self):
         self.modules = {}
-        self.state_lattice = {} 
+        self.state_lattice = {}
+        # Per-module tau is also packed into one array (slot order = _module_order)
+        # for the vectorized sync; every write updates both.
+        self._module_order = []
+        self._slot = {}
+        self._tau_arr = np.ones(_INITIAL_SLOTS, dtype=np.float64)
         self.global_tau = 1.0
         self.last_audit = time.time()
 
@@ -21,6 +29,14 @@ class MLHub:
         """Register a new ML or Autopoietic module."""
         print(f"[MLHub] Registering Module: {module_id}")
         self.modules[module_id] = module_instance
+        slot = self._slot.get(module_id)
+        if slot is None:
+            slot = len(self._module_order)
+            if slot == len(self._tau_arr):
+                self._tau_arr = np.concatenate((self._tau_arr, np.ones_like(self._tau_arr)))
+            self._module_order.append(module_id)
+            self._slot[module_id] = slot
+        self._tau_arr[slot] = 1.0
         self.state_lattice[module_id] = {"tau": 1.0, "status": "ACTIVE"}
 
     def invoke_module(self, module_id, method, *args, **kwargs):
@@ -29,7 +45,7 @@ class MLHub:
             return {"status": "error", "reason": f"Module {module_id} not found"}
         
         # Stability Gate (Rule I)
-        module_tau = self.state_lattice[module_id]["tau"]
+        module_tau = float(self._tau_arr[self._slot[module_id]])
         if module_tau < 0.9412:
             print(f"[MLHub] BLOCK: {module_id} stability ({module_tau:.4f}) below threshold.")
             return {"status": "error", "reason": "Stability violation", "tau": module_tau}
@@ -47,18 +63,24 @@ class MLHub:
     def _update_telemetry(self, module_id, result):
         """Internal telemetry for tau/J management."""
         # Simplified: success increases tau, error decreases it.
+        slot = self._slot[module_id]
+        tau = float(self._tau_arr[slot])
         if isinstance(result, dict) and result.get("status") == "error":
-            self.state_lattice[module_id]["tau"] = max(0.5, self.state_lattice[module_id]["tau"] - 0.05)
+            tau = max(0.5, tau - 0.05)
         else:
-            self.state_lattice[module_id]["tau"] = min(1.0, self.state_lattice[module_id]["tau"] + 0.01)
+            tau = min(1.0, tau + 0.01)
+        self._tau_arr[slot] = tau
+        self.state_lattice[module_id]["tau"] = tau
 
     def perform_system_sync(self):
         """Helical synchronization of all ML module states."""
         print(f"[MLHub] Synchronizing {len(self.modules)} modules...")
         self.last_audit = time.time()
-        for mid, state in self.state_lattice.items():
-            # Apply Homeostasis (Rule XIV)
-            state["tau"] += 0.1 * (1.0 - state["tau"])
+        # Apply Homeostasis (Rule XIV) to every module in one pass
+        taus = self._tau_arr[:len(self._module_order)]
+        taus += 0.1 * (1.0 - taus)
+        for mid, tau in zip(self._module_order, taus.tolist()):
+            self.state_lattice[mid]["tau"] = tau
         return self.state_lattice
 
 if __name__ == "__main__":
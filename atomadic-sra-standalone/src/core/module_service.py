@@ -3,10 +3,58 @@ import time
 import json
 import logging
 import uuid
-from typing import Dict, List, Optional
+from string import Template
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import Dict, Iterable, List, Optional
 
 logger = logging.getLogger("ModuleService")
 
+# Shared pool for scaffold writes; the .py and .html files of a module are independent
+_WRITE_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="ModuleWrite")
+
+
+def _write_text(path: str, text: str):
+    with open(path, "w") as f:
+        f.write(text)
+
+
+# Scaffold templates, parsed once at import
+_PY_TPL = Template('''# ${module_id} // Autopoietic Module v4.3.0.0
+# Prompt: ${prompt}
+
+class ${class_name}Module:
+    def __init__(self):
+        self.id = "${module_id}"
+        self.features = ${features}
+
+    def execute(self):
+        return {"status": "active", "module": "${module_id}"}
+
+if __name__ == "__main__":
+    m = ${class_name}Module()
+    print(m.execute())
+''')
+
+_HTML_TPL = Template('''<!-- ${module_id} Fragment // v4.3.0.0 -->
+<div class="card" style="grid-column: span 12;">
+    <h3 class="card-title">${upper}</h3>
+    <div style="margin-top: 2rem; color: #94a3b8; font-family: 'JetBrains Mono'; font-size: 0.9rem;">
+        <p>Manifested via Revelation Engine.</p>
+        <p>Prompt: ${prompt}</p>
+        <div style="margin-top: 2rem;">
+            <strong>Active Features:</strong>
+            <ul style="margin-top: 10px;">
+                ${li_html}
+            </ul>
+        </div>
+    </div>
+    <div style="margin-top: 2rem; display: flex; gap: 1rem;">
+        <button class="btn btn-evolution" onclick="showToast('Evolving ${module_id}...')">EVOLVE_MODULE</button>
+        <button class="btn" style="border-color: var(--neon-pink); color: var(--neon-pink);" onclick="showToast('Deprecating...')">DEPRECATE</button>
+    </div>
+</div>
+''')
+
 class ModuleService:
     """
     Sovereign Module Creation Engine v4.3.0.0
@@ -25,51 +73,38 @@ class ModuleService:
         """
         Scaffolds a new module (Python + HTML).
         """
+        result = self._manifest(module_id, prompt, features)
+        self.plugin_service.flush()
+        return result
+
+    def manifest_modules_bulk(self, specs: Iterable[Dict]) -> List[Dict]:
+        """
+        Scaffolds many modules; specs are dicts with module_id, prompt and features.
+        Marketplace listings are persisted in a single vault update at the end.
+        """
+        results = [self._manifest(spec["module_id"], spec["prompt"], spec["features"]) for spec in specs]
+        self.plugin_service.flush()
+        return results
+
+    def _manifest(self, module_id: str, prompt: str, features: List[str]) -> Dict:
         logger.info(f"[Autopoiesis] Manifesting module: {module_id}")
         
         # 1. Scaffolding Python Backend (Placeholder for future LLM integration)
-        py_template = f'''# {module_id} // Autopoietic Module v4.3.0.0
-# Prompt: {prompt}
-
-class {module_id.capitalize()}Module:
-    def __init__(self):
-        self.id = "{module_id}"
-        self.features = {features}
-
-    def execute(self):
-        return {{"status": "active", "module": "{module_id}"}}
-
-if __name__ == "__main__":
-    m = {module_id.capitalize()}Module()
-    print(m.execute())
-'''
+        class_name = module_id.capitalize()
+        py_template = _PY_TPL.substitute(module_id=module_id, prompt=prompt,
+                                         class_name=class_name, features=features)
         py_path = os.path.join(self.modules_dir, f"{module_id}.py")
-        with open(py_path, "w") as f:
-            f.write(py_template)
 
         # 2. Scaffolding HTML Fragment
-        html_template = f'''<!-- {module_id} Fragment // v4.3.0.0 -->
-<div class="card" style="grid-column: span 12;">
-    <h3 class="card-title">{module_id.upper()}</h3>
-    <div style="margin-top: 2rem; color: #94a3b8; font-family: 'JetBrains Mono'; font-size: 0.9rem;">
-        <p>Manifested via Revelation Engine.</p>
-        <p>Prompt: {prompt}</p>
-        <div style="margin-top: 2rem;">
-            <strong>Active Features:</strong>
-            <ul style="margin-top: 10px;">
-                {' '.join([f'<li>{feat}</li>' for feat in features])}
-            </ul>
-        </div>
-    </div>
-    <div style="margin-top: 2rem; display: flex; gap: 1rem;">
-        <button class="btn btn-evolution" onclick="showToast('Evolving {module_id}...')">EVOLVE_MODULE</button>
-        <button class="btn" style="border-color: var(--neon-pink); color: var(--neon-pink);" onclick="showToast('Deprecating...')">DEPRECATE</button>
-    </div>
-</div>
-'''
+        li_html = " ".join(f"<li>{feat}</li>" for feat in features)
+        html_template = _HTML_TPL.substitute(module_id=module_id, prompt=prompt,
+                                             upper=module_id.upper(), li_html=li_html)
         html_path = os.path.join(self.pages_dir, f"{module_id}.html")
-        with open(html_path, "w") as f:
-            f.write(html_template)
+        writes = [_WRITE_POOL.submit(_write_text, py_path, py_template),
+                  _WRITE_POOL.submit(_write_text, html_path, html_template)]
+        wait(writes)
+        for fut in writes:
+            fut.result()  # re-raise any write failure
 
         # 3. Registering with Plugin Service
         self.plugin_service.register_product(module_id, {
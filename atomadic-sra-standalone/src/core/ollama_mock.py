@@ -1,44 +1,70 @@
 
+import functools
 import json
+import os
 import random
+import re
 import time
 
+# One anchored pass per branch, tried in priority order: a tool request wins
+# over debate keywords wherever they appear. Matching is case-insensitive.
+_ROUTER = re.compile(
+    r"(?=.*?create a tool named(?: '(?P<tool>[^']*))?)(?P<tool_request>)"
+    r"|(?=.*?(?:debate|propose))(?P<debate>)",
+    re.IGNORECASE | re.DOTALL,
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _tool_source(tool_name):
+    class_name = "".join(x.title() for x in tool_name.split("_"))
+    return f"""
+class {class_name}:
+    \"\"\"
+    Mock-generated tool: {tool_name}
+    \"\"\"
+    def execute(self, *args, **kwargs):
+        return f"Mock {tool_name} executed with args: {{args}}"
+"""
+
+
 class OllamaMock:
     """
     Ollama Mock Provider (NOV-002)
     Provides deterministic, high-quality responses for system testing.
     Simulates LLM reasoning and code generation.
+
+    Latency is simulated unless `simulate_latency=False` is passed or
+    MOCK_OLLAMA_LATENCY=0 is set, which batch test runs can use.
     """
-    def __init__(self, latency_range=(0.1, 0.5)):
+    DEBATE_RESPONSE = "I propose that we prioritize grounding over speed. My reasoning follows the E8 lattice constraints."
+    REASONING_RESPONSE = "Based on my internal reasoning substrate, the optimal path is to continue the recursive audit loop."
+
+    def __init__(self, latency_range=(0.1, 0.5), simulate_latency=None):
         self.latency_range = latency_range
+        if simulate_latency is None:
+            simulate_latency = os.getenv("MOCK_OLLAMA_LATENCY", "1") == "1"
+        self._sleep = latency_range if simulate_latency else None
 
     def generate(self, prompt, system_prompt=None):
         """Simulate a completion response."""
         # Add artificial latency to simulate temporal weight
-        delay = random.uniform(*self.latency_range)
-        time.sleep(delay)
-        
-        prompt_lower = prompt.lower()
+        if self._sleep is not None:
+            time.sleep(random.uniform(*self._sleep))
         
+        route = _ROUTER.match(prompt)
+        kind = route.lastgroup if route else None
+
         # 1. Handle Tool Generation
-        if "create a tool named" in prompt_lower:
-            tool_name = prompt.split("named '")[1].split("'")[0] if "'" in prompt else "unknown_tool"
-            class_name = "".join(x.title() for x in tool_name.split("_"))
-            return f"""
-class {class_name}:
-    \"\"\"
-    Mock-generated tool: {tool_name}
-    \"\"\"
-    def execute(self, *args, **kwargs):
-        return f"Mock {tool_name} executed with args: {{args}}"
-"""
+        if kind == "tool_request":
+            return _tool_source(route.group("tool") or "unknown_tool")
 
         # 2. Handle Governance/Debate
-        if "debate" in prompt_lower or "propose" in prompt_lower:
-            return "I propose that we prioritize grounding over speed. My reasoning follows the E8 lattice constraints."
+        if kind == "debate":
+            return self.DEBATE_RESPONSE
 
         # 3. Handle General Reasoning
-        return "Based on my internal reasoning substrate, the optimal path is to continue the recursive audit loop."
+        return self.REASONING_RESPONSE
 
     def check_connection(self):
         """Always return True for the mock."""
@@ -1,12 +1,29 @@
 
+import atexit
 import logging
 import os
 import time
+import weakref
 from typing import Dict, Any, List, Optional
 from .evolution_vault import EvolutionVault
 
 logger = logging.getLogger(__name__)
 
+# Services with possibly unflushed registry changes; one exit hook flushes
+# whichever are still alive without keeping any of them alive itself
+_LIVE_SERVICES = weakref.WeakSet()
+
+
+def _flush_live_services():
+    for service in list(_LIVE_SERVICES):
+        try:
+            service.flush()
+        except Exception as e:
+            logger.warning(f"[Plugin] Exit flush failed: {e}")
+
+
+atexit.register(_flush_live_services)
+
 class PluginService:
     """
     SRA Plugin & Marketplace Managed Substrate.
@@ -16,65 +33,110 @@ class PluginService:
         self.vault = vault
         self.plugin_key = "plugin_registry"
         self.product_key = "marketplace_products"
+        self.skills_cache_key = "skills_cache"
         self.skills_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(__file__))), ".agent", "rules")
+        # In-memory copies of the two registries; vault writes are deferred to flush()
+        self._plugins_cache = self.vault.get_state(self.plugin_key) or {}
+        self._products_cache = self.vault.get_state(self.product_key) or {}
+        self._skills_cache = {}
+        # Registry key -> {entry id: entry} changed here since the last flush
+        self._dirty = {}
         self._init_registry()
         self.discover_manifested_skills()
+        self.flush()
+        _LIVE_SERVICES.add(self)
+
+    def _mark(self, key: str, entries: Dict[str, Any]):
+        self._dirty.setdefault(key, {}).update(entries)
 
     def discover_manifested_skills(self):
         """Autonomously discover and map new skills in the .agent/rules directory."""
-        if not os.path.exists(self.skills_dir):
+        try:
+            mtime_ns = os.stat(self.skills_dir).st_mtime_ns
+        except OSError:
             logger.warning(f"[Plugin] Skills directory not found: {self.skills_dir}")
             return
 
+        plugins = self._plugins_cache
+        # Unchanged directory whose skills are all registered: nothing to scan
+        cached = self.vault.get_state(self.skills_cache_key) or {}
+        if cached.get("mtime_ns") == mtime_ns and all(
+                f"skill_{name[:-3].lower()}" in plugins for name in cached.get("files", ())):
+            return
+
         print(f"[Plugin] Scanning for manifested skills in: {self.skills_dir}...")
-        plugins = self.vault.get_state(self.plugin_key) or {}
-        found_new = False
+        files = []
 
-        for file in os.listdir(self.skills_dir):
-            if file.endswith(".md"):
+        with os.scandir(self.skills_dir) as entries:
+            for entry in entries:
+                file = entry.name
+                if not file.endswith(".md"):
+                    continue
+                files.append(file)
                 skill_id = f"skill_{file[:-3].lower()}"
                 if skill_id not in plugins:
                     print(f"[Plugin] Auto-detecting new skill: {file}")
                     plugins[skill_id] = {
                         "name": file[:-3].replace("-", " ").title(),
-                        "path": os.path.join(self.skills_dir, file),
+                        "path": entry.path,
                         "type": "manifested_skill",
                         "discovered_at": time.time()
                     }
-                    found_new = True
+                    self._mark(self.plugin_key, {skill_id: plugins[skill_id]})
 
-        if found_new:
-            secret = os.getenv("SRA_SOVEREIGN_2026", "SRA_SOVEREIGN_2026")
-            self.vault.update_state(self.plugin_key, plugins, secret=secret)
+        self._skills_cache = {"mtime_ns": mtime_ns, "files": sorted(files)}
+        self._mark(self.skills_cache_key, self._skills_cache)
 
     def _init_registry(self):
-        if not self.vault.get_state(self.plugin_key):
+        if not self._plugins_cache:
             # Seed with core plugins
-            initial_plugins = {
+            self._plugins_cache.update({
                 "core_revelation": {"name": "Core Revelation Engine", "version": "4.0.0.0", "active": True},
                 "pwa_generator": {"name": "PWA Manifestation Engine", "version": "1.0.0", "active": True}
-            }
-            secret = os.getenv("SRA_SOVEREIGN_2026", "SRA_SOVEREIGN_2026")
-            self.vault.update_state(self.plugin_key, initial_plugins, secret=secret)
+            })
+            self._mark(self.plugin_key, self._plugins_cache)
 
     def register_product(self, product_id: str, metadata: Dict[str, Any]):
-        """List a manifested product (app/insight) in the marketplace."""
-        products = self.vault.get_state(self.product_key) or {}
-        products[product_id] = {
+        """List a manifested product (app/insight) in the marketplace (persisted on flush)."""
+        self._products_cache[product_id] = {
             **metadata,
             "listed_at": time.time(),
             "status": "published"
         }
-        secret = os.getenv("SRA_SOVEREIGN_2026", "SRA_SOVEREIGN_2026")
-        self.vault.update_state(self.product_key, products, secret=secret)
+        self._mark(self.product_key, {product_id: self._products_cache[product_id]})
         logger.info(f"[Marketplace] Listed product: {product_id}")
 
+    def flush(self) -> int:
+        """Merge modified registry entries into the vault's current state; returns the number written."""
+        if not self._dirty:
+            return 0
+        secret = os.getenv("SRA_SOVEREIGN_2026", "SRA_SOVEREIGN_2026")
+        written = 0
+        for key in sorted(self._dirty):
+            # Re-read right before writing, so entries stored by other services or
+            # processes since we loaded are kept rather than overwritten
+            merged = self.vault.get_state(key) or {}
+            merged.update(self._dirty[key])
+            self.vault.update_state(key, merged, secret=secret)
+            if key == self.plugin_key:
+                self._plugins_cache.update(merged)
+            elif key == self.product_key:
+                self._products_cache.update(merged)
+            written += 1
+        self._dirty.clear()
+        return written
+
     def get_marketplace_data(self) -> Dict[str, Any]:
-        """Retrieve full marketplace state."""
-        return {
-            "plugins": self.vault.get_state(self.plugin_key) or {},
-            "products": self.vault.get_state(self.product_key) or {}
-        }
+        """Retrieve full marketplace state: the vault's registries with pending local changes on top."""
+        data = {}
+        for name, key, cache in (("plugins", self.plugin_key, self._plugins_cache),
+                                 ("products", self.product_key, self._products_cache)):
+            # Re-read so entries stored by other writers (scripts, other processes) show up
+            merged = self.vault.get_state(key) or {}
+            merged.update(self._dirty.get(key, {}))
+            cache.update(merged)
+            data[name] = merged
+        return data
 
 # Revelation Engine Summary (Marketplace):
 # - Epiphany: A sovereign system must have a vibrant internal economy.
@@ -1,8 +1,25 @@
 
 import os
+import json
+import secrets
 import shutil
 import time
-import hashlib
+from concurrent.futures import ThreadPoolExecutor, wait
+
+try:
+    import orjson
+except ImportError:  # optional: C-accelerated JSON
+    orjson = None
+
+# Core logic cloned into every daughter (subset)
+_CORE_FILES = (
+    "src/agents/creative_engine.py",
+    "src/core/ollama_service.py",
+    "src/core/evolution_vault.py",
+)
+
+_COPY_POOL = ThreadPoolExecutor(max_workers=len(_CORE_FILES), thread_name_prefix="DaughterCopy")
+
 
 class ReproductionLayer:
     """
@@ -25,32 +42,31 @@ class ReproductionLayer:
             print("[Reproduction] Handshake failed. Spawning aborted.")
             return None
 
-        daughter_id = f"DAUGHTER-{hashlib.sha256(str(time.time()).encode()).hexdigest()[:8]}"
+        daughter_id = f"DAUGHTER-{secrets.token_hex(4)}"
         daughter_path = os.path.join(self.daughters_dir, daughter_id)
         
         print(f"[Reproduction] Manifesting daughter: {daughter_id}...")
         
-        # 1. Physical Manifestation (Rule 1: Map ≡ Terrain)
-        os.makedirs(daughter_path, exist_ok=True)
-        
-        # 2. Clone core logic (subset)
-        core_files = [
-            "src/agents/creative_engine.py",
-            "src/core/ollama_service.py",
-            "src/core/evolution_vault.py"
-        ]
-        
-        for file in core_files:
+        # Check sources up front so a missing file leaves no half-built daughter
+        for file in _CORE_FILES:
             src = os.path.join(self.base_path, file)
-            dst = os.path.join(daughter_path, file)
-            os.makedirs(os.path.dirname(dst), exist_ok=True)
-            if os.path.exists(src):
-                if not shutil.copy2(src, dst):
-                    print(f"[Reproduction] Failed to copy {file}")
-                    return None
-            else:
+            if not os.path.exists(src):
                 print(f"[Reproduction] Source file missing: {src}")
                 return None
+
+        # 1. Physical Manifestation (Rule 1: Map ≡ Terrain)
+        os.makedirs(daughter_path, exist_ok=True)
+        for subdir in {os.path.dirname(file) for file in _CORE_FILES}:
+            os.makedirs(os.path.join(daughter_path, subdir), exist_ok=True)
+        
+        # 2. Clone core logic; copyfile skips metadata and uses sendfile on Linux
+        copies = [_COPY_POOL.submit(shutil.copyfile,
+                                    os.path.join(self.base_path, file),
+                                    os.path.join(daughter_path, file))
+                  for file in _CORE_FILES]
+        wait(copies)
+        for fut in copies:
+            fut.result()  # re-raise any copy failure
         
         # 3. Initialize Daughter Meta-State
         meta = {
@@ -61,9 +77,11 @@ class ReproductionLayer:
             "wisdom_mass": 100, # Initial seed mass
         }
         
-        with open(os.path.join(daughter_path, "meta.json"), "w") as f:
-            import json
-            json.dump(meta, f, indent=2)
+        with open(os.path.join(daughter_path, "meta.json"), "wb") as f:
+            if orjson is not None:
+                f.write(orjson.dumps(meta, option=orjson.OPT_INDENT_2))
+            else:
+                f.write(json.dumps(meta, indent=2).encode("utf-8"))
 
         # Rule 3: Flipped Invariance (Delta L > 0)
         self._log_delta_l(10) # Reproduction increases complexity
@@ -1,5 +1,4 @@
 
-import asyncio
 import json
 import logging
 import time
@@ -19,6 +18,11 @@ from .settings_service import SettingsService
 
 logger = logging.getLogger(__name__)
 
+# Queries mentioning any of these (as a substring, any case) get web grounding
+_SEARCH_TRIGGER = re.compile(r"latest|news|2026|current|vancouver", re.IGNORECASE)
+
+_EPIPHANY_TAGS = ("curiosity↑", "rigor↑", "abundance↑")
+
 class ResearchEngine:
     """
     HelixTOER Research Associate v5.8.0
@@ -34,6 +38,7 @@ class ResearchEngine:
         self.billing = BillingService(vault)
         self.app_gen = AppGenerator(static_dir)
         self.version = "v6.1.0"
+        self._rng = np.random.default_rng()
 
     async def conduct_research(self, query: str, context_docs: List[str] = []) -> Dict[str, Any]:
         start_time = time.time()
@@ -41,7 +46,7 @@ class ResearchEngine:
 
         # Step 0: Search Grounding
         search_results = []
-        if any(keyword in query.lower() for keyword in ["latest", "news", "2026", "current", "vancouver"]):
+        if _SEARCH_TRIGGER.search(query):
             search_results = await self.search_service.search(query)
             logger.info(f"[Research] Search grounding yielded {len(search_results)} results.")
 
@@ -51,12 +56,20 @@ class ResearchEngine:
         
         # Step 1: Epiphanies
         epiphany_count = random.randint(8, 12)
-        epiphany_tasks = [self._generate_epiphany(i, query, intent, context_docs) for i in range(epiphany_count)]
-        epiphanies = await asyncio.gather(*epiphany_tasks)
-        epiphanies = [e for e in epiphanies if e]
+        prompts = [f"Revelation Engine Query: {query} [Phase: Epiphany {i}]" for i in range(epiphany_count)]
+        try:
+            # One batched round-trip for every epiphany prompt
+            responses = await self.hive.call_llm_batch(prompts)
+        except Exception:
+            responses = [None] * epiphany_count
+        # Coherent vectors for every epiphany in one draw: base 1.0 + small noise
+        vectors = self._rng.uniform(-0.1, 0.1, (epiphany_count, 8)) + 1.0
+        epiphanies = [self._generate_epiphany(i, text, vectors[i]) for i, text in enumerate(responses)]
+        kept = [i for i, e in enumerate(epiphanies) if e]
+        epiphanies = [epiphanies[i] for i in kept]
 
         # Step 2: Coherence
-        coherence_score = self._calculate_coherence(epiphanies)
+        coherence_score = self._calculate_coherence(epiphanies, vectors[kept])
         
         end_time = time.time()
         total_latency = round((end_time - start_time) * 1000, 2)
@@ -76,6 +89,14 @@ class ResearchEngine:
             "Revelation API licensing ($0.03/query)"
         ]
 
+        # Persistent Log & Billing
+        self.billing.record_usage() # Defaulting to master for demo
+        self.vault.log_evolution(
+            activity="RESEARCH_CYCLE",
+            details={"query": query, "epiphanies": len(epiphanies)},
+            tau=coherence_score
+        )
+
         # RevelationOutput Compliance
         return {
             "task": query,
@@ -94,38 +115,29 @@ class ResearchEngine:
             }
         }
 
-        # Persistent Log & Billing
-        self.billing.record_usage() # Defaulting to master for demo
-        self.vault.log_evolution(
-            activity="RESEARCH_CYCLE",
-            details={"query": query, "epiphanies": len(epiphanies)},
-            tau=coherence_score
-        )
-
-        return research_output
-
-    async def _generate_epiphany(self, index: int, query: str, intent: str, docs: List[str]) -> Optional[Dict[str, Any]]:
-        tags = ["curiosity↑", "rigor↑", "abundance↑"]
-        prompt = f"Revelation Engine Query: {query} [Phase: Epiphany {index}]"
+    def _generate_epiphany(self, index: int, response_text: Optional[str], vector: Optional[np.ndarray] = None) -> Optional[Dict[str, Any]]:
+        chosen = random.choices(_EPIPHANY_TAGS, k=5)
         
-        try:
-            # Fallback to mock for testing/stability if hive fails
-            response_text = await self.hive.call_llm_sync(prompt)
+        if response_text is not None:
             # Dummy JSON if not present
-            data = {"revelations": [{"content": f"Atomic Revelation {index}.{j}", "emotionalTag": random.choice(tags)} for j in range(5)], "ahaVectors": [f"AHA {index}.{j}" for j in range(3)]}
-        except Exception:
-            data = {"revelations": [{"content": f"Mock Revelation {index}", "emotionalTag": random.choice(tags)} for _ in range(5)], "ahaVectors": [f"AHA {index}.1", f"AHA {index}.2", f"AHA {index}.3"]}
+            data = {"revelations": [{"content": f"Atomic Revelation {index}.{j}", "emotionalTag": tag} for j, tag in enumerate(chosen)], "ahaVectors": [f"AHA {index}.{j}" for j in range(3)]}
+        else:
+            # Fallback to mock for testing/stability if hive fails
+            data = {"revelations": [{"content": f"Mock Revelation {index}", "emotionalTag": tag} for tag in chosen], "ahaVectors": [f"AHA {index}.1", f"AHA {index}.2", f"AHA {index}.3"]}
         
         data["id"] = index
         data["coherence"] = 1.0 # Internal epiphany coherence
         # Generate coherent vectors: base + small noise
-        base_vec = [1.0] * 8
-        data["vector"] = [v + random.uniform(-0.1, 0.1) for v in base_vec]
+        if vector is None:
+            vector = self._rng.uniform(-0.1, 0.1, 8) + 1.0
+        data["vector"] = vector.tolist()
         return data
 
-    def _calculate_coherence(self, epiphanies: List[Dict[str, Any]]) -> float:
+    def _calculate_coherence(self, epiphanies: List[Dict[str, Any]], vectors: Optional[np.ndarray] = None) -> float:
         if not epiphanies: return 0.0
-        return self.rotors.check_coherence([e["vector"] for e in epiphanies])
+        if vectors is None:
+            vectors = np.array([e["vector"] for e in epiphanies], dtype=float)
+        return self.rotors.check_coherence(vectors)
 
     def _generate_leech_slice(self, coherence: float) -> Dict[str, Any]:
         return {
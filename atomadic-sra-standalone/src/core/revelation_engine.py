@@ -1,15 +1,52 @@
 
+import os
 import time
 import re
+from concurrent.futures import ThreadPoolExecutor
 from src.core.leech_outer import LeechOuter
 
+
+def _lower_pattern(pattern):
+    """Lowercase a pattern's literal text, leaving escapes such as \\s or \\S intact."""
+    return re.sub(r"\\.|[^\\]+", lambda m: m.group() if m.group()[0] == "\\" else m.group().lower(), pattern)
+
+
+def _iter_py(root):
+    """
+    Paths of the .py files under `root` in os.walk order (a directory's files,
+    then its subdirectories), via scandir's cached entry types.
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return
+    subdirs = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if is_dir:
+            # Like os.walk, symlinked directories are listed but not descended into
+            if not entry.is_symlink():
+                subdirs.append(entry.path)
+        elif entry.name.endswith(".py"):
+            yield entry.path
+    for path in subdirs:
+        yield from _iter_py(path)
+
+
 class RevelationEngine:
     """
     Revelation Engine (NOV-015)
     Recursive Sovereign Refinement (RSR).
     Sovereignly audits agent code and internal state against the Aletheia Axioms.
+
+    Pass `simulate_delay=True` to restore the 3 x 100ms self-reflection pause per audit.
     """
-    def __init__(self):
+    def __init__(self, simulate_delay=False):
+        self.simulate_delay = simulate_delay
         self.axioms = [
             "Rule I: Stability Threshold",
             "Rule II: Wisdom Mass Growth",
@@ -38,23 +75,31 @@ class RevelationEngine:
                 r"secret\s*=\s*['\"].*['\"]"
             ]
         }
+        # One pass per rule over the lowercased code (so no IGNORECASE folding).
+        # Each pattern sits in its own lookahead so matches never consume text
+        # another pattern needs.
+        self._compiled = {
+            rule: re.compile("|".join(f"(?=(?P<g{i}>{_lower_pattern(p)}))" for i, p in enumerate(patterns)))
+            for rule, patterns in self.violation_patterns.items()
+        }
 
     def audit_directory(self, directory_path: str):
         """Perform a mass audit of all Python files in a directory."""
         print(f"[RevelationEngine] Mass Audit Initiated: {directory_path}")
+        paths = list(_iter_py(directory_path))
         results = {}
-        import os
-        for root, _, files in os.walk(directory_path):
-            for file in files:
-                if file.endswith(".py"):
-                    full_path = os.path.join(root, file)
-                    with open(full_path, "r", encoding="utf-8", errors="ignore") as f:
-                        code = f.read()
-                        res = self.perform_recursive_refinement(file, code)
-                        if res["status"] == "REJECTED":
-                            results[file] = res["violations"]
+        # Reads and scans overlap across threads; map() keeps walk order for the results
+        with ThreadPoolExecutor() as ex:
+            for path, res in zip(paths, ex.map(self._audit_file, paths)):
+                if res["status"] == "REJECTED":
+                    results[os.path.basename(path)] = res["violations"]
         return results
 
+    def _audit_file(self, full_path: str):
+        with open(full_path, "r", encoding="utf-8", errors="ignore") as f:
+            code = f.read()
+        return self.perform_recursive_refinement(os.path.basename(full_path), code)
+
     def perform_recursive_refinement(self, agent_name, code):
         """
         Recursive Sovereign Refinement.
@@ -63,13 +108,18 @@ class RevelationEngine:
         print(f"[RevelationEngine] Initiating RSR Audit for {agent_name}...")
         violations = []
         
-        # 1. Pattern Scan (SovereignScanner)
-        for rule, patterns in self.violation_patterns.items():
-            for pattern in patterns:
-                if re.search(pattern, code, re.IGNORECASE):
-                    # Check if it's explicitly allowed (Aletheia Bypass)
-                    if "ALETHEIA_BYPASS" not in code:
-                        violations.append(f"Axiom Violation ({rule}): Pattern '{pattern}' detected.")
+        # 1. Pattern Scan (SovereignScanner); explicitly allowed code (Aletheia Bypass) is skipped
+        if "ALETHEIA_BYPASS" not in code:
+            code_lc = code.lower()
+            for rule, rx in self._compiled.items():
+                patterns = self.violation_patterns[rule]
+                hit = set()
+                for m in rx.finditer(code_lc):
+                    hit.add(m.lastgroup)
+                    if len(hit) == len(patterns):
+                        break
+                violations.extend(f"Axiom Violation ({rule}): Pattern '{pattern}' detected."
+                                  for i, pattern in enumerate(patterns) if f"g{i}" in hit)
 
         # 2. Logic Flow Check
         if len(code) < 10:
@@ -78,8 +128,9 @@ class RevelationEngine:
         status = "PASSED" if not violations else "REJECTED"
         
         # Recursive Self-Reflection (Simulated 3 loops)
-        for i in range(3):
-            time.sleep(0.1) # Computation delay
+        if self.simulate_delay:
+            for i in range(3):
+                time.sleep(0.1) # Computation delay
         
         # Implementation 5: Leech-Fusion Reasoning Compression
         leech = LeechOuter()
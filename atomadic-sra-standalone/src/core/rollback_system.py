@@ -2,9 +2,65 @@
 import os
 import json
 import shutil
+import threading
 import time
 import hashlib
 import glob
+import sqlite3
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import pyzstd
+except ImportError:  # optional: zstd object compression, zlib otherwise
+    pyzstd = None
+
+# Codec name -> decoder for stored blobs
+_DECODERS = {"zlib": zlib.decompress, "raw": bytes}
+if pyzstd is not None:
+    _DECODERS["zstd"] = pyzstd.decompress
+
+# Pre-SQLite loose object files: suffix -> codec, tried in order; bare <hash> files predate compression
+_LEGACY_SUFFIXES = ((".zst", "zstd"), (".zz", "zlib"), ("", "raw"))
+
+
+_HASH_CHUNK = 1 << 16
+
+# Shared pool for per-file reads, hashes and writes; hashlib and file I/O release the GIL
+_IO_POOL = ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 2), thread_name_prefix="Rollback")
+
+
+def _compress_object(data):
+    """Compressed blob and its codec name for a stored object."""
+    if pyzstd is not None:
+        return pyzstd.compress(data, 3), "zstd"
+    return zlib.compress(data, 6), "zlib"
+
+
+def _iter_py(root):
+    """
+    Paths of the .py files under `root` in os.walk order (a directory's files,
+    then its subdirectories), via scandir's cached entry types. __pycache__ is skipped.
+    """
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return
+    subdirs = []
+    for entry in entries:
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if is_dir:
+            # Like os.walk, symlinked directories are listed but not descended into
+            if entry.name != "__pycache__" and not entry.is_symlink():
+                subdirs.append(entry.path)
+        elif entry.name.endswith(".py"):
+            yield entry.path
+    for path in subdirs:
+        yield from _iter_py(path)
 
 class RollbackSystem:
     """
@@ -21,71 +77,208 @@ class RollbackSystem:
     def __init__(self, project_root, snapshot_dir=None):
         self.project_root = os.path.abspath(project_root)
         self.snapshot_dir = snapshot_dir or os.path.join(self.project_root, "data", "rollback")
-        self.manifest_file = os.path.join(self.snapshot_dir, "manifest.json")
-        self.objects_dir = os.path.join(self.snapshot_dir, "objects")
+        # Snapshots are appended one JSON line each; the head pointer lives apart
+        self.log_file = os.path.join(self.snapshot_dir, "manifest.jsonl")
+        self.head_file = os.path.join(self.snapshot_dir, "head.json")
+        self.manifest_file = os.path.join(self.snapshot_dir, "manifest.json")  # pre-JSONL format
+        self.objects_db = os.path.join(self.snapshot_dir, "objects.db")
+        self.objects_dir = os.path.join(self.snapshot_dir, "objects")  # pre-SQLite loose objects
         
-        os.makedirs(self.objects_dir, exist_ok=True)
+        os.makedirs(self.snapshot_dir, exist_ok=True)
+        self._legacy_objects = os.path.isdir(self.objects_dir)
+        self._db = self._open_object_db()
+        # One connection shared by the I/O pool; sqlite3 calls are serialized here
+        self._db_lock = threading.Lock()
+        # rel path -> (mtime_ns, size, sha256) from the last working-tree scan
+        self._working_cache = {}
         
         self.manifest = self._load_manifest()
+        self._reindex()
+
+    def _open_object_db(self):
+        db = sqlite3.connect(self.objects_db, isolation_level=None, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.execute("CREATE TABLE IF NOT EXISTS obj (hash TEXT PRIMARY KEY, codec TEXT NOT NULL, data BLOB NOT NULL)")
+        return db
+
+    def close(self):
+        """Close the object store connection."""
+        with self._db_lock:
+            self._db.close()
+
+    def _reindex(self):
+        """Name/id -> position of the first matching snapshot, as _find_snapshot resolves them."""
+        self._by_name = {}
+        self._by_id = {}
+        for i, snap in enumerate(self.manifest["snapshots"]):
+            self._index_snapshot(i, snap)
+
+    def _index_snapshot(self, i, snap):
+        self._by_name.setdefault(snap["name"], i)
+        self._by_id.setdefault(snap["id"], i)
 
     def _load_manifest(self):
+        if os.path.exists(self.log_file):
+            with open(self.log_file, "r", encoding="utf-8") as f:
+                snapshots = [json.loads(line) for line in f if line.strip()]
+            head = None
+            if os.path.exists(self.head_file):
+                with open(self.head_file, "r") as f:
+                    head = json.load(f).get("current_head")
+            return {"snapshots": snapshots, "current_head": head}
         if os.path.exists(self.manifest_file):
+            # Migrate a legacy single-document manifest to the log format
             with open(self.manifest_file, "r") as f:
-                return json.load(f)
+                manifest = json.load(f)
+            self._rewrite_log(manifest["snapshots"])
+            self._save_head(manifest.get("current_head"))
+            return manifest
         return {"snapshots": [], "current_head": None}
 
-    def _save_manifest(self):
-        with open(self.manifest_file, "w") as f:
-            json.dump(self.manifest, f, indent=2)
+    def _append_snapshot(self, snapshot):
+        """O(1) manifest write: one line per snapshot instead of rewriting history."""
+        with open(self.log_file, "a", encoding="utf-8") as f:
+            f.write(json.dumps(snapshot) + "\n")
+
+    def _rewrite_log(self, snapshots):
+        """Atomically replace the snapshot log (used when history is pruned)."""
+        tmp = self.log_file + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.writelines(json.dumps(snap) + "\n" for snap in snapshots)
+        os.replace(tmp, self.log_file)
+
+    def _save_head(self, head):
+        with open(self.head_file, "w") as f:
+            json.dump({"current_head": head}, f)
 
     def _hash_content(self, content):
         return hashlib.sha256(content.encode("utf-8")).hexdigest()
 
+    def _hash_and_meta(self, path, chunks=None):
+        """
+        (sha256 hex, byte size, newline count) of a file in one streaming pass.
+        Pass a list as `chunks` to also collect the bytes read.
+        """
+        h = hashlib.sha256()
+        size = 0
+        newlines = 0
+        with open(path, "rb") as f:
+            while chunk := f.read(_HASH_CHUNK):
+                h.update(chunk)
+                size += len(chunk)
+                newlines += chunk.count(b"\n")
+                if chunks is not None:
+                    chunks.append(chunk)
+        return h.hexdigest(), size, newlines
+
     def _store_object(self, content):
         """Content-addressable storage: store by SHA-256 hash."""
-        obj_hash = self._hash_content(content)
-        obj_path = os.path.join(self.objects_dir, obj_hash)
-        if not os.path.exists(obj_path):
-            with open(obj_path, "w", encoding="utf-8") as f:
-                f.write(content)
+        data = content.encode("utf-8")
+        return self._store_object_bytes(data, hashlib.sha256(data).hexdigest())
+
+    def _has_object(self, obj_hash):
+        with self._db_lock:
+            row = self._db.execute("SELECT 1 FROM obj WHERE hash=?", (obj_hash,)).fetchone()
+        return row is not None
+
+    def _store_object_bytes(self, data, obj_hash):
+        if not self._has_object(obj_hash):
+            # Compress outside the lock; INSERT OR IGNORE settles concurrent stores of the same content
+            blob, codec = _compress_object(data)
+            with self._db_lock:
+                self._db.execute("INSERT OR IGNORE INTO obj VALUES (?, ?, ?)", (obj_hash, codec, blob))
         return obj_hash
 
     def _retrieve_object(self, obj_hash):
         """Retrieve stored content by hash."""
-        obj_path = os.path.join(self.objects_dir, obj_hash)
-        if os.path.exists(obj_path):
-            with open(obj_path, "r", encoding="utf-8") as f:
-                return f.read()
+        data = self._retrieve_object_bytes(obj_hash)
+        return data.decode("utf-8") if data is not None else None
+
+    def _retrieve_object_bytes(self, obj_hash):
+        with self._db_lock:
+            row = self._db.execute("SELECT codec, data FROM obj WHERE hash=?", (obj_hash,)).fetchone()
+        if row is not None:
+            decode = _DECODERS.get(row[0])
+            return decode(row[1]) if decode else None
+        if self._legacy_objects:
+            obj_path = os.path.join(self.objects_dir, obj_hash)
+            for suffix, codec in _LEGACY_SUFFIXES:
+                if codec in _DECODERS and os.path.exists(obj_path + suffix):
+                    with open(obj_path + suffix, "rb") as f:
+                        return _DECODERS[codec](f.read())
         return None
 
+    def _snapshot_file(self, filepath, prev=None):
+        """
+        Hash and store one source file as raw bytes; returns its manifest entry.
+        If `prev` (the entry from the last snapshot) has the same mtime and size,
+        the file is assumed unchanged and is not read at all.
+        """
+        st = os.stat(filepath)
+        if prev and prev.get("mtime") == st.st_mtime_ns and prev["size"] == st.st_size:
+            return prev
+        chunks = []
+        obj_hash, size, newlines = self._hash_and_meta(filepath, chunks)
+        self._store_object_bytes(b"".join(chunks), obj_hash)
+        return {
+            "hash": obj_hash,
+            "size": size,
+            "lines": newlines + 1,
+            "mtime": st.st_mtime_ns
+        }
+
+    def _source_paths(self):
+        """(absolute path, project-relative path) of every .py file under src/, in walk order."""
+        src_dir = os.path.join(self.project_root, "src")
+        return [(filepath, os.path.relpath(filepath, self.project_root)) for filepath in _iter_py(src_dir)]
+
+    def _scan_working_tree(self):
+        """
+        rel path -> {"hash", "size", "mtime"} for the current source tree.
+        Files whose (mtime, size) match the previous scan reuse the cached hash.
+        """
+        cache = self._working_cache
+        fresh = {}
+
+        def scan(item):
+            filepath, rel_path = item
+            st = os.stat(filepath)
+            hit = cache.get(rel_path)
+            if hit and hit[0] == st.st_mtime_ns and hit[1] == st.st_size:
+                obj_hash = hit[2]
+            else:
+                obj_hash = self._hash_and_meta(filepath)[0]
+            fresh[rel_path] = (st.st_mtime_ns, st.st_size, obj_hash)
+            return rel_path, {"hash": obj_hash, "size": st.st_size, "mtime": st.st_mtime_ns}
+
+        files = dict(_IO_POOL.map(scan, self._source_paths()))
+        self._working_cache = fresh  # drops files that no longer exist
+        return files
+
     def create_snapshot(self, name, description=""):
         """
         Create a named snapshot of all source files.
         """
         print(f"[Rollback] Creating snapshot: {name}")
         
-        file_hashes = {}
-        file_count = 0
+        prev_files = self.manifest["snapshots"][-1]["files"] if self.manifest["snapshots"] else {}
         
-        src_dir = os.path.join(self.project_root, "src")
-        for root, dirs, files in os.walk(src_dir):
-            # Skip __pycache__
-            dirs[:] = [d for d in dirs if d != "__pycache__"]
-            for fname in files:
-                if fname.endswith(".py"):
-                    filepath = os.path.join(root, fname)
-                    rel_path = os.path.relpath(filepath, self.project_root)
-                    
-                    with open(filepath, "r", encoding="utf-8") as f:
-                        content = f.read()
-                    
-                    obj_hash = self._store_object(content)
-                    file_hashes[rel_path] = {
-                        "hash": obj_hash,
-                        "size": len(content),
-                        "lines": content.count("\n") + 1
-                    }
-                    file_count += 1
+        paths = self._source_paths()
+        # Hash/store in parallel; map() keeps walk order for the manifest.
+        # All object inserts land in one transaction.
+        with self._db_lock:
+            self._db.execute("BEGIN")
+        try:
+            entries = list(_IO_POOL.map(lambda p: self._snapshot_file(p[0], prev_files.get(p[1])), paths))
+        except BaseException:
+            with self._db_lock:
+                self._db.execute("ROLLBACK")
+            raise
+        with self._db_lock:
+            self._db.execute("COMMIT")
+        file_hashes = {rel_path: entry for (_, rel_path), entry in zip(paths, entries)}
+        file_count = len(file_hashes)
         
         snapshot = {
             "name": name,
@@ -96,9 +289,11 @@ class RollbackSystem:
             "id": hashlib.sha256(f"{name}{time.time()}".encode()).hexdigest()[:12]
         }
         
+        self._index_snapshot(len(self.manifest["snapshots"]), snapshot)
         self.manifest["snapshots"].append(snapshot)
         self.manifest["current_head"] = snapshot["id"]
-        self._save_manifest()
+        self._append_snapshot(snapshot)
+        self._save_head(snapshot["id"])
         
         print(f"[Rollback] Snapshot '{name}' created: {file_count} files, ID={snapshot['id']}")
         return snapshot
@@ -122,25 +317,31 @@ class RollbackSystem:
         restored = 0
         errors = 0
         
-        for rel_path, file_info in target["files"].items():
-            full_path = os.path.join(self.project_root, rel_path)
-            content = self._retrieve_object(file_info["hash"])
-            
-            if content is not None:
-                os.makedirs(os.path.dirname(full_path), exist_ok=True)
-                with open(full_path, "w", encoding="utf-8") as f:
-                    f.write(content)
+        items = list(target["files"].items())
+        for (rel_path, _), ok in zip(items, _IO_POOL.map(self._restore_file, items)):
+            if ok:
                 restored += 1
             else:
                 print(f"   Missing object for {rel_path}")
                 errors += 1
         
         self.manifest["current_head"] = target["id"]
-        self._save_manifest()
+        self._save_head(target["id"])
         
         print(f"[Rollback] Complete: {restored} restored, {errors} errors")
         return {"status": "success", "restored": restored, "errors": errors, "target": target["name"]}
 
+    def _restore_file(self, item):
+        rel_path, file_info = item
+        content = self._retrieve_object_bytes(file_info["hash"])
+        if content is None:
+            return False
+        full_path = os.path.join(self.project_root, rel_path)
+        os.makedirs(os.path.dirname(full_path), exist_ok=True)
+        with open(full_path, "wb") as f:
+            f.write(content)
+        return True
+
     def diff(self, snapshot_a, snapshot_b=None):
         """
         Show differences between two snapshots.
@@ -157,17 +358,7 @@ class RollbackSystem:
             files_b = snap_b["files"]
         else:
             # Compare to current working tree
-            files_b = {}
-            src_dir = os.path.join(self.project_root, "src")
-            for root, dirs, files in os.walk(src_dir):
-                dirs[:] = [d for d in dirs if d != "__pycache__"]
-                for fname in files:
-                    if fname.endswith(".py"):
-                        filepath = os.path.join(root, fname)
-                        rel_path = os.path.relpath(filepath, self.project_root)
-                        with open(filepath, "r", encoding="utf-8") as f:
-                            content = f.read()
-                        files_b[rel_path] = {"hash": self._hash_content(content), "size": len(content)}
+            files_b = self._scan_working_tree()
         
         added = []
         removed = []
@@ -209,23 +400,31 @@ class RollbackSystem:
         valid = 0
         missing = 0
         
+        snapshots = [snap for snap in snapshots if snap]
+        # Snapshots share most objects; check each distinct one once, in parallel
+        hashes = list({info["hash"] for snap in snapshots for info in snap["files"].values()})
+        status = dict(zip(hashes, _IO_POOL.map(self._check_object, hashes)))
+        
         for snap in snapshots:
-            if not snap:
-                continue
             for rel_path, info in snap["files"].items():
                 total += 1
-                content = self._retrieve_object(info["hash"])
-                if content is not None:
-                    actual_hash = self._hash_content(content)
-                    if actual_hash == info["hash"]:
-                        valid += 1
-                    else:
-                        print(f"   CORRUPT: {rel_path} in {snap['name']}")
-                else:
+                ok = status[info["hash"]]
+                if ok:
+                    valid += 1
+                elif ok is None:
                     missing += 1
+                else:
+                    print(f"   CORRUPT: {rel_path} in {snap['name']}")
         
         return {"total": total, "valid": valid, "missing": missing, "integrity": valid / total if total > 0 else 1.0}
 
+    def _check_object(self, obj_hash):
+        """True if the stored object matches its hash, False if corrupt, None if missing."""
+        content = self._retrieve_object_bytes(obj_hash)
+        if content is None:
+            return None
+        return hashlib.sha256(content).hexdigest() == obj_hash
+
     def list_snapshots(self):
         """List all available snapshots."""
         return [{
@@ -237,10 +436,8 @@ class RollbackSystem:
         } for s in self.manifest["snapshots"]]
 
     def _find_snapshot(self, name_or_id):
-        for s in self.manifest["snapshots"]:
-            if s["name"] == name_or_id or s["id"] == name_or_id:
-                return s
-        return None
+        hits = [i for i in (self._by_name.get(name_or_id), self._by_id.get(name_or_id)) if i is not None]
+        return self.manifest["snapshots"][min(hits)] if hits else None
 
     def cleanup_old(self, keep_count=10):
         """Remove old snapshots, keeping the most recent ones."""
@@ -249,6 +446,7 @@ class RollbackSystem:
         
         removed = len(self.manifest["snapshots"]) - keep_count
         self.manifest["snapshots"] = self.manifest["snapshots"][-keep_count:]
-        self._save_manifest()
+        self._rewrite_log(self.manifest["snapshots"])
+        self._reindex()
         print(f"[Rollback] Cleaned up {removed} old snapshots")
         return removed
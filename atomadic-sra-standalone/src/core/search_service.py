@@ -1,16 +1,79 @@
 
 import os
 import json
+import asyncio
+import functools
 import logging
 import time
 import urllib.request
 import urllib.parse
+from collections import OrderedDict
 from typing import List, Dict, Any, Optional
+
+import numpy as np
+
+try:
+    import aiohttp
+except ImportError:  # optional: provider calls fall back to urllib in a worker thread
+    aiohttp = None
+
 from .evolution_vault import EvolutionVault
 from .e8_core import E8Core
 
 logger = logging.getLogger(__name__)
 
+# Char i lands in dim i % 8; precomputed for typical title+snippet lengths
+_BIN_IDX_LEN = 4096
+_BIN_IDX = np.arange(_BIN_IDX_LEN) % 8
+_MEM_CACHE_SIZE = 512
+_HTTP_TIMEOUT = 10
+
+# Offline fallback results: (title template, url, snippet template)
+_SIM_RESULTS = (
+    (
+        "Strategic Analysis of {query}",
+        "https://sra.atomadic.ai/sim-search/1",
+        "Synthetic grounding for '{query}'. This data is generated via internal knowledge base fallback."
+    ),
+    (
+        "Revelation Insights: {query}",
+        "https://sra.atomadic.ai/sim-search/2",
+        "Coherence resonance suggests high relevance in the Vancouver tech corridor for this particular objective."
+    ),
+)
+
+
+def _bin_idx(n):
+    if n <= _BIN_IDX_LEN:
+        return _BIN_IDX[:n]
+    return np.arange(n) % 8
+
+
+@functools.lru_cache(maxsize=4096)
+def _text_vec(text):
+    """8-D projection of `text`, memoized as an immutable tuple."""
+    # bincount adds each bin's ord(char)/255 terms in text order, as a per-char loop would;
+    # surrogatepass keeps lone surrogates (which ord() accepts) from raising
+    codes = np.frombuffer(text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+    return tuple(np.bincount(_bin_idx(codes.size), weights=codes / 255.0, minlength=8).tolist())
+
+
+def _text_vecs(texts):
+    """(N, 8) projections of `texts`, all rows accumulated by a single bincount."""
+    codes = np.frombuffer("".join(texts).encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+    lengths = np.fromiter(map(len, texts), dtype=np.intp, count=len(texts))
+    starts = np.cumsum(lengths) - lengths
+    # Flat bin of each char: its row's block of 8, then its position within the text mod 8
+    pos = np.arange(codes.size) - np.repeat(starts, lengths)
+    bins = np.repeat(np.arange(len(texts)) * 8, lengths) + pos % 8
+    return np.bincount(bins, weights=codes / 255.0, minlength=len(texts) * 8).reshape(-1, 8)
+
+
+def _copy_results(results):
+    """Fresh result dicts, so cached entries never share state with what callers hold."""
+    return [dict(r) for r in results]
+
+
 class SearchService:
     """
     Sovereign Search Service (v5.8.0)
@@ -25,19 +88,24 @@ class SearchService:
         self.google_key = os.getenv("GOOGLE_SEARCH_API_KEY")
         self.google_cx = os.getenv("GOOGLE_SEARCH_CX")
         self.cache_expiry = 86400  # 24 hours
+        # In-process LRU tier in front of the vault: query -> (stored_at, count, results)
+        self._mem_cache: OrderedDict = OrderedDict()
+        self._session = None
+        self._session_loop = None
 
     async def search(self, query: str, count: int = 5) -> List[Dict[str, Any]]:
         """Perform search with caching and fallback."""
-        cached = self._check_cache(query)
+        cached = self._check_cache(query, count)
         if cached:
             logger.info(f"[Search] Cache hit for: {query}")
-            return cached
+            # Copies: callers (and re-grounding) edit result dicts in place
+            return _copy_results(cached[:count])
 
         results = []
         if self.bing_key:
-            results = self._search_bing(query, count)
+            results = await self._search_bing(query, count)
         elif self.google_key:
-            results = self._search_google(query, count)
+            results = await self._search_google(query, count)
         
         if not results:
             logger.warning(f"[Search] No API keys or results. Using fallback for: {query}")
@@ -46,19 +114,20 @@ class SearchService:
         # Implementation 7: E8-Grounded Fact Checking
         grounded_results = self._ground_results(query, results)
         
-        self._save_to_cache(query, grounded_results)
+        self._save_to_cache(query, count, _copy_results(grounded_results))
         return grounded_results
 
     def _ground_results(self, query: str, results: List[Dict]) -> List[Dict]:
         """Filter and score results by projecting them into the E8 lattice."""
         print(f"[Search] Grounding {len(results)} results via E8 resonance...")
+        if not results:
+            return []
         query_vec = self._text_to_vec(query)
-        
+        R = _text_vecs([res["title"] + " " + res["snippet"] for res in results])
+        resonances = self.e8.compute_field_resonance_batch(query_vec, R)
+
         grounded = []
-        for res in results:
-            res_vec = self._text_to_vec(res["title"] + " " + res["snippet"])
-            resonance = self.e8.compute_field_resonance(query_vec, res_vec)
-            
+        for res, resonance in zip(results, resonances.tolist()):
             # Metadata τ (trust) annotation
             res["resonance"] = round(resonance, 4)
             res["tau"] = round(0.9 + 0.1 * resonance, 4)
@@ -66,71 +135,106 @@ class SearchService:
             # Filter results with low resonance (low grounding)
             if resonance > 0.3:
                 grounded.append(res)
-                
+
         return sorted(grounded, key=lambda x: x["resonance"], reverse=True)
 
     def _text_to_vec(self, text: str) -> List[float]:
         """Simple deterministic projection for E8 grounding."""
-        # Create an 8D vector from string content
-        vec = [0.0] * 8
-        for i, char in enumerate(text):
-            vec[i % 8] += ord(char) / 255.0
-        return vec
+        # Create an 8D vector from string content (cached; re-grounding the
+        # same snippets or retrying a provider skips the projection)
+        return list(_text_vec(text))
 
-    def _search_bing(self, query: str, count: int) -> List[Dict[str, Any]]:
+    async def _get_json(self, url: str, headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """GET `url` and decode the JSON body without blocking the event loop."""
+        if aiohttp is None:
+            return await asyncio.to_thread(self._get_json_blocking, url, headers)
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            # Sessions are bound to the loop that created them
+            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=_HTTP_TIMEOUT))
+            self._session_loop = loop
+        async with self._session.get(url, headers=headers) as response:
+            response.raise_for_status()
+            return await response.json(content_type=None)
+
+    @staticmethod
+    def _get_json_blocking(url: str, headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        req = urllib.request.Request(url, headers=headers or {})
+        with urllib.request.urlopen(req, timeout=_HTTP_TIMEOUT) as response:
+            return json.loads(response.read().decode())
+
+    async def close(self):
+        """Release the shared HTTP session, if one was opened."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        self._session_loop = None
+
+    async def _search_bing(self, query: str, count: int) -> List[Dict[str, Any]]:
         endpoint = "https://api.bing.microsoft.com/v7.0/search"
         params = urllib.parse.urlencode({"q": query, "count": count, "textDecorations": True, "textFormat": "HTML"})
         url = f"{endpoint}?{params}"
         headers = {"Ocp-Apim-Subscription-Key": self.bing_key}
         
         try:
-            req = urllib.request.Request(url, headers=headers)
-            with urllib.request.urlopen(req, timeout=10) as response:
-                data = json.loads(response.read().decode())
-                return [{"title": r["name"], "url": r["url"], "snippet": r["snippet"]} for r in data.get("webPages", {}).get("value", [])]
+            data = await self._get_json(url, headers)
+            return [{"title": r["name"], "url": r["url"], "snippet": r["snippet"]} for r in data.get("webPages", {}).get("value", [])]
         except Exception as e:
             logger.error(f"[Search] Bing error: {e}")
             return []
 
-    def _search_google(self, query: str, count: int) -> List[Dict[str, Any]]:
+    async def _search_google(self, query: str, count: int) -> List[Dict[str, Any]]:
         endpoint = "https://www.googleapis.com/customsearch/v1"
         params = urllib.parse.urlencode({"key": self.google_key, "cx": self.google_cx, "q": query, "num": count})
         url = f"{endpoint}?{params}"
         
         try:
-            with urllib.request.urlopen(url, timeout=10) as response:
-                data = json.loads(response.read().decode())
-                return [{"title": r.get("title"), "url": r.get("link"), "snippet": r.get("snippet")} for r in data.get("items", [])]
+            data = await self._get_json(url)
+            return [{"title": r.get("title"), "url": r.get("link"), "snippet": r.get("snippet")} for r in data.get("items", [])]
         except Exception as e:
             logger.error(f"[Search] Google error: {e}")
             return []
 
     def _simulate_search(self, query: str, count: int) -> List[Dict[str, Any]]:
         return [
-            {
-                "title": f"Strategic Analysis of {query}",
-                "url": "https://sra.atomadic.ai/sim-search/1",
-                "snippet": f"Synthetic grounding for '{query}'. This data is generated via internal knowledge base fallback."
-            },
-            {
-                "title": f"Revelation Insights: {query}",
-                "url": "https://sra.atomadic.ai/sim-search/2",
-                "snippet": "Coherence resonance suggests high relevance in the Vancouver tech corridor for this particular objective."
-            }
-        ][:count]
-
-    def _check_cache(self, query: str) -> Optional[List[Dict[str, Any]]]:
+            {"title": title.format(query=query), "url": url, "snippet": snippet.format(query=query)}
+            for title, url, snippet in _SIM_RESULTS[:count]
+        ]
+
+    def _check_cache(self, query: str, count: int) -> Optional[List[Dict[str, Any]]]:
+        """Cached results for `query`, if they were fetched with at least `count` requested."""
+        now = time.time()
+        entry = self._mem_cache.get(query)
+        if entry is not None:
+            if now - entry[0] < self.cache_expiry:
+                self._mem_cache.move_to_end(query)
+                return entry[2] if entry[1] >= count else None
+            del self._mem_cache[query]
+
+        # Memory miss: fall back to the (linear) vault scan
         items = self.vault.query("evolutions", activity="SEARCH_CACHE", query=query)
         if items:
             latest = items[-1]
-            if time.time() - latest.get("timestamp_unix", 0) < self.cache_expiry:
-                return latest["details"]["results"]
+            stored_at = latest.get("timestamp_unix", 0)
+            if now - stored_at < self.cache_expiry:
+                results = latest["details"]["results"]
+                # Entries logged before "count" was recorded serve any count, as they always did
+                fetched = latest["details"].get("count", count)
+                self._remember(query, fetched, results, stored_at)
+                return results if fetched >= count else None
         return None
 
-    def _save_to_cache(self, query: str, results: List[Dict[str, Any]]):
+    def _remember(self, query: str, count: int, results: List[Dict[str, Any]], stored_at: float):
+        self._mem_cache[query] = (stored_at, count, results)
+        self._mem_cache.move_to_end(query)
+        if len(self._mem_cache) > _MEM_CACHE_SIZE:
+            self._mem_cache.popitem(last=False)
+
+    def _save_to_cache(self, query: str, count: int, results: List[Dict[str, Any]]):
+        self._remember(query, count, results, time.time())
         self.vault.log_evolution(
             activity="SEARCH_CACHE",
-            details={"query": query, "results": results, "timestamp_unix": time.time()},
+            details={"query": query, "count": count, "results": results, "timestamp_unix": time.time()},
             tau=1.0
         )
 
@@ -151,6 +255,7 @@ if __name__ == "__main__":
             print(f"[Self-Test] Search Verification: SUCCESS ({len(results)} results)")
         else:
             print("[Self-Test] Search Verification: FAILURE")
+        await service.close()
             
         if os.path.exists(vault_path):
             os.remove(vault_path)
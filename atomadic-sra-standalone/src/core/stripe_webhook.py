@@ -17,6 +17,7 @@ import json
 import hashlib
 import hmac
 import os
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -38,18 +39,43 @@ PRICE_TIERS = {
 _SUB_STORE_PATH = ROOT / "data" / "subscriptions.json"
 
 
-def _load_subscribers() -> dict:
-    if _SUB_STORE_PATH.exists():
+# Parsed store, reused while the file's (mtime_ns, size) is unchanged
+_SUBS_CACHE = {"mtime_ns": None, "size": None, "data": {}}
+_SUBS_LOCK  = threading.Lock()
+
+
+def _copy_subscribers(subs: dict) -> dict:
+    # Records are flat dicts, so copying each one isolates callers from the cache
+    return {k: dict(v) if isinstance(v, dict) else v for k, v in subs.items()}
+
+
+def _cached_subscribers() -> dict:
+    """Shared parsed store — read-only; use _load_subscribers() to modify."""
+    with _SUBS_LOCK:
         try:
-            return json.loads(_SUB_STORE_PATH.read_text(encoding="utf-8"))
-        except Exception:
-            return {}
-    return {}
+            st = _SUB_STORE_PATH.stat()
+        except OSError:
+            _SUBS_CACHE.update(mtime_ns=None, size=None, data={})
+            return _SUBS_CACHE["data"]
+        if st.st_mtime_ns != _SUBS_CACHE["mtime_ns"] or st.st_size != _SUBS_CACHE["size"]:
+            try:
+                data = json.loads(_SUB_STORE_PATH.read_text(encoding="utf-8"))
+            except Exception:
+                data = {}
+            _SUBS_CACHE.update(mtime_ns=st.st_mtime_ns, size=st.st_size, data=data)
+        return _SUBS_CACHE["data"]
+
+
+def _load_subscribers() -> dict:
+    return _copy_subscribers(_cached_subscribers())
 
 
 def _save_subscribers(subs: dict) -> None:
     _SUB_STORE_PATH.parent.mkdir(parents=True, exist_ok=True)
-    _SUB_STORE_PATH.write_text(json.dumps(subs, indent=2), encoding="utf-8")
+    with _SUBS_LOCK:
+        _SUB_STORE_PATH.write_text(json.dumps(subs, indent=2), encoding="utf-8")
+        st = _SUB_STORE_PATH.stat()
+        _SUBS_CACHE.update(mtime_ns=st.st_mtime_ns, size=st.st_size, data=_copy_subscribers(subs))
 
 
 # ── Signature verification ─────────────────────────────────────────────────────
@@ -180,25 +206,34 @@ def handle_event(payload: bytes, sig_header: str) -> tuple[dict, int]:
 # ── Subscription query helpers (for dashboard) ─────────────────────────────────
 
 def get_subscriber(customer_id: str) -> dict | None:
-    return _load_subscribers().get(customer_id)
+    sub = _cached_subscribers().get(customer_id)
+    return dict(sub) if isinstance(sub, dict) else sub
 
 
 def get_all_subscribers() -> list[dict]:
-    subs = _load_subscribers()
+    subs = _cached_subscribers()
     return [{"customer_id": k, **v} for k, v in subs.items()]
 
 
 def get_mrr_estimate() -> dict:
     """Estimate MRR from active subscriptions."""
-    subs   = _load_subscribers()
-    active = [s for s in subs.values() if s.get("active")]
-    mrr    = sum(PRICE_TIERS.get(s.get("tier", "starter"), {}).get("price_usd", 0) or 0
-                 for s in active)
+    tiers  = dict.fromkeys(PRICE_TIERS, 0)
+    mrr    = 0
+    active = 0
+    for s in _cached_subscribers().values():
+        if not s.get("active"):
+            continue
+        active += 1
+        tier = s.get("tier")
+        if tier in tiers:
+            tiers[tier] += 1
+        # A subscription without a tier is billed as starter but counted under none
+        mrr += PRICE_TIERS.get(s.get("tier", "starter"), {}).get("price_usd", 0) or 0
     return {
-        "active_subscriptions": len(active),
+        "active_subscriptions": active,
         "estimated_mrr_usd": mrr,
         "estimated_arr_usd": mrr * 12,
-        "tiers": {t: sum(1 for s in active if s.get("tier") == t) for t in PRICE_TIERS},
+        "tiers": tiers,
     }
 
 
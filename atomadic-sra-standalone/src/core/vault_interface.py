@@ -14,9 +14,13 @@ on-chain (Base L2). IP valuation anchor: Kalra 2023.
 Audit: τ=1.0, ΔL>0
 """
 
+import copy
 import json
+import os
+import threading
 import uuid
 import hashlib
+from collections import Counter
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
@@ -24,7 +28,8 @@ from typing import Any
 __version__ = "1.0.0"
 
 ROOT       = Path(__file__).parent.parent.parent
-VAULT_PATH = ROOT / "data" / "evolution_vault.json"
+VAULT_PATH = ROOT / "data" / "evolution_vault.jsonl"   # append-only, one entry per line
+_LEGACY_VAULT_PATH = ROOT / "data" / "evolution_vault.json"
 
 # ERC-4626 metaphor mappings:
 #   deposit(assets, receiver) → log output, return share_id
@@ -36,23 +41,105 @@ VAULT_PATH = ROOT / "data" / "evolution_vault.json"
 
 # ── Storage ────────────────────────────────────────────────────────────────────
 
+def _migrate_legacy() -> None:
+    """Seed the JSONL log from the pre-JSONL single-document vault, or create it empty."""
+    try:
+        entries = json.loads(_LEGACY_VAULT_PATH.read_text(encoding="utf-8"))
+    except Exception:
+        entries = []
+    # The same path holds EvolutionVault's category dict; only a list is ours
+    if not isinstance(entries, list):
+        entries = []
+    # Write aside and rename, so a reader never sees a half-migrated log
+    tmp = VAULT_PATH.with_suffix(".jsonl.tmp")
+    try:
+        VAULT_PATH.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.writelines(json.dumps(e) + "\n" for e in entries)
+        os.replace(tmp, VAULT_PATH)
+    except OSError:
+        pass  # read-only data dir: readers see an empty vault, as before
+
+
+def _read_entries() -> list[dict]:
+    entries = []
+    with open(VAULT_PATH, "r", encoding="utf-8") as f:
+        for line in f:
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                continue  # blank or torn line
+    return entries
+
+
+# Parsed log plus running counters, valid while the file's (mtime_ns, size) is unchanged
+_VAULT_CACHE = {"mtime_ns": None, "size": None, "entries": [],
+                "deposits": 0, "mints": 0, "by_receiver": Counter(), "migrated": False}
+_VAULT_LOCK  = threading.Lock()
+
+
+def _index(entry: dict) -> None:
+    _VAULT_CACHE["entries"].append(entry)
+    kind = entry.get("type")
+    if kind == "deposit":
+        _VAULT_CACHE["deposits"] += 1
+    elif kind == "mint":
+        _VAULT_CACHE["mints"] += 1
+    _VAULT_CACHE["by_receiver"][entry.get("receiver")] += 1
+
+
+def _refresh() -> dict:
+    """The cache, re-read (one parse, one counting pass) only if the log changed. Hold _VAULT_LOCK."""
+    if not _VAULT_CACHE["migrated"]:
+        # Once per process: the legacy document is never re-parsed on later reads
+        _VAULT_CACHE["migrated"] = True
+        if not VAULT_PATH.exists():
+            _migrate_legacy()
+    try:
+        st = VAULT_PATH.stat()
+        key = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        key = (None, None)
+    if key != (_VAULT_CACHE["mtime_ns"], _VAULT_CACHE["size"]):
+        _VAULT_CACHE.update(mtime_ns=key[0], size=key[1], entries=[],
+                            deposits=0, mints=0, by_receiver=Counter())
+        for entry in (_read_entries() if key[0] is not None else []):
+            _index(entry)
+    return _VAULT_CACHE
+
+
 def _load() -> list[dict]:
-    if VAULT_PATH.exists():
-        try:
-            return json.loads(VAULT_PATH.read_text(encoding="utf-8"))
-        except Exception:
-            return []
-    return []
+    with _VAULT_LOCK:
+        return list(_refresh()["entries"])
 
 
-def _save(entries: list[dict]) -> None:
+def _append(entry: dict) -> None:
+    """O(1) insert: one write of one line, never a rewrite of the vault."""
+    line = (json.dumps(entry) + "\n").encode("utf-8")
     VAULT_PATH.parent.mkdir(parents=True, exist_ok=True)
-    VAULT_PATH.write_text(json.dumps(entries, indent=2), encoding="utf-8")
+    with _VAULT_LOCK:
+        cache = _refresh()
+        with open(VAULT_PATH, "ab") as f:
+            start = f.tell()
+            f.write(line)
+            f.flush()
+            st = os.fstat(f.fileno())
+        if start == cache["size"] and st.st_size == start + len(line):
+            # Nobody else wrote in between: index just this entry instead of re-reading
+            _index(json.loads(line))
+            cache.update(mtime_ns=st.st_mtime_ns, size=st.st_size)
+        else:
+            cache.update(mtime_ns=None, size=None)
+
+
+# Canonical form behind content_hash; byte-identical to json.dumps(sort_keys=True, default=str)
+# but built once rather than per call. Changing it would change every content hash.
+_CANONICAL_JSON = json.JSONEncoder(sort_keys=True, default=str).encode
 
 
 def _sha(content: Any) -> str:
-    raw = json.dumps(content, sort_keys=True, default=str)
-    return hashlib.sha256(raw.encode()).hexdigest()[:16]
+    # ensure_ascii output, so the ASCII codec is exact
+    return hashlib.sha256(_CANONICAL_JSON(content).encode("ascii")).hexdigest()[:16]
 
 
 # ── ERC-4626 Interface ─────────────────────────────────────────────────────────
@@ -64,7 +151,6 @@ def deposit(assets: dict, receiver: str = "sra_system", tags: list[str] | None =
 
     ERC-4626 analogy: deposit(assets, receiver) → shares minted
     """
-    entries = _load()
     share_id = str(uuid.uuid4()).replace("-", "")[:16]
     entry = {
         "share_id": share_id,
@@ -76,8 +162,7 @@ def deposit(assets: dict, receiver: str = "sra_system", tags: list[str] | None =
         "timestamp": datetime.now(timezone.utc).isoformat(),
         "tau": 1.0,
     }
-    entries.append(entry)
-    _save(entries)
+    _append(entry)
     print(f"[Vault] deposit → share_id={share_id} hash={entry['content_hash']}")
     return share_id
 
@@ -87,7 +172,6 @@ def mint(receiver: str, metadata: dict | None = None) -> str:
     Mint a new evolution cycle share (marks a self-improvement event).
     ERC-4626 analogy: mint(shares, receiver) → assets calculated
     """
-    entries = _load()
     share_id = str(uuid.uuid4()).replace("-", "")[:16]
     entry = {
         "share_id": share_id,
@@ -95,10 +179,9 @@ def mint(receiver: str, metadata: dict | None = None) -> str:
         "receiver": receiver,
         "metadata": metadata or {},
         "timestamp": datetime.now(timezone.utc).isoformat(),
-        "delta_m": len(entries) + 1,   # ΔM > 0 by construction
+        "delta_m": total_assets() + 1,   # ΔM > 0 by construction
     }
-    entries.append(entry)
-    _save(entries)
+    _append(entry)
     print(f"[Vault] mint → share_id={share_id} ΔM={entry['delta_m']}")
     return share_id
 
@@ -109,14 +192,15 @@ def withdraw(tag: str | None = None, receiver: str | None = None,
     Retrieve vault entries by tag or receiver.
     ERC-4626 analogy: withdraw(assets, receiver, owner)
     """
-    entries = _load()
+    with _VAULT_LOCK:
+        entries = _refresh()["entries"]
     results = []
     for e in reversed(entries):
         if tag and tag not in e.get("tags", []):
             continue
         if receiver and e.get("receiver") != receiver:
             continue
-        results.append(e)
+        results.append(copy.deepcopy(e))  # callers must not edit the cached log
         if len(results) >= limit:
             break
     return results
@@ -124,12 +208,14 @@ def withdraw(tag: str | None = None, receiver: str | None = None,
 
 def total_assets() -> int:
     """Total number of vault entries. ERC-4626: totalAssets()."""
-    return len(_load())
+    with _VAULT_LOCK:
+        return len(_refresh()["entries"])
 
 
 def balance_of(receiver: str) -> int:
     """Count of shares owned by receiver. ERC-4626: balanceOf(owner)."""
-    return sum(1 for e in _load() if e.get("receiver") == receiver)
+    with _VAULT_LOCK:
+        return _refresh()["by_receiver"][receiver]
 
 
 def get_ip_valuation() -> dict:
@@ -137,9 +223,11 @@ def get_ip_valuation() -> dict:
     Estimate IP valuation based on vault depth.
     Anchor: Kalra 2023 — AI agent framework IP: $50K–$500K per novel method.
     """
-    count = total_assets()
-    deposits  = sum(1 for e in _load() if e.get("type") == "deposit")
-    mints     = sum(1 for e in _load() if e.get("type") == "mint")
+    with _VAULT_LOCK:
+        cache = _refresh()
+        count     = len(cache["entries"])
+        deposits  = cache["deposits"]
+        mints     = cache["mints"]
     # Heuristic: each mint = one evolution cycle = $5K–$25K IP value
     low  = mints * 5_000  + deposits * 500
     high = mints * 25_000 + deposits * 2_000
@@ -38,7 +38,7 @@ import uvicorn
 
 from src.core.evolution_vault import EvolutionVault
 from src.core.ollama_service import OllamaService
-from src.core.hive_bridge import HiveBridge
+from src.core.hive_bridge import HiveBridge, thaw_info
 from src.agents.hive_agent_adapter import HiveAgentAdapter
 from src.core.research_engine import ResearchEngine
 from src.core.branding_service import BrandingService
@@ -298,7 +298,7 @@ async def list_hive_agents():
 
 @app.get("/api/hive/governance")
 async def get_hive_governance():
-    return JSONResponse(hive.get_governance_info())
+    return JSONResponse(thaw_info(hive.get_governance_info()))
 
 @app.post("/api/hive/repair")
 async def run_hive_repair(request: Request):
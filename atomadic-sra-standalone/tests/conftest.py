@@ -0,0 +1,26 @@
+"""
+Shared pytest fixtures for the SRA test suite.
+"""
+
+import os
+import shutil
+import sys
+
+import pytest
+
+PROJECT_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+SHIPPED_VAULT = os.path.join(PROJECT_ROOT, "data", "evolution_vault.json")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def isolated_vault(tmp_path_factory):
+    """Point every default EvolutionVault at a temp copy of the shipped vault."""
+    vault_file = tmp_path_factory.mktemp("vault") / "evolution_vault.json"
+    shutil.copyfile(SHIPPED_VAULT, vault_file)
+    mp = pytest.MonkeyPatch()
+    mp.setenv("SRA_VAULT_FILE", str(vault_file))
+    yield vault_file
+    mp.undo()
@@ -0,0 +1,44 @@
+import unittest
+import os
+import sys
+import tempfile
+
+# Ensure project root is on path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.evolution_vault import EvolutionVault
+from src.core.plugin_service import PluginService
+
+SECRET = os.getenv("SRA_SOVEREIGN_2026", "SRA_SOVEREIGN_2026")
+
+
+class TestPluginService(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.vault_file = os.path.join(self.tmp.name, "evolution_vault.json")
+        self.service = PluginService(EvolutionVault(self.vault_file))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_marketplace_sees_other_writers(self):
+        """Listings stored through another vault handle show up without a restart."""
+        other = EvolutionVault(self.vault_file)
+        products = other.get_state("marketplace_products") or {}
+        products["external_app"] = {"name": "External", "status": "published"}
+        other.update_state("marketplace_products", products, secret=SECRET)
+
+        data = self.service.get_marketplace_data()
+        self.assertIn("external_app", data["products"])
+        self.assertIn("core_revelation", data["plugins"])
+
+    def test_marketplace_includes_pending_listings(self):
+        """Unflushed local listings are overlaid on the vault's registries."""
+        self.service.register_product("local_app", {"name": "Local"})
+        data = self.service.get_marketplace_data()
+        self.assertEqual(data["products"]["local_app"]["status"], "published")
+        self.assertNotIn("local_app", EvolutionVault(self.vault_file).get_state("marketplace_products") or {})
+
+
+if __name__ == "__main__":
+    unittest.main()
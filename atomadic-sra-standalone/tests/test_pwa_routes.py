@@ -7,10 +7,11 @@ import os
 # Ensure project root is on path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from src.server.app import app
 
 class TestPWARoutes(unittest.TestCase):
     def setUp(self):
+        # Imported here, not at collection, so the app's vault lands in the test temp dir
+        from src.server.app import app
         self.client = TestClient(app)
 
     def test_manifest_is_json(self):
@@ -11,16 +11,20 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 from src.core.research_engine import ResearchEngine
 from src.core.hive_bridge import HiveBridge
 from src.core.evolution_vault import EvolutionVault
+from src.core.settings_service import SettingsService
 
 class TestResearchEngine(unittest.IsolatedAsyncioTestCase):
     async def asyncSetUp(self):
         self.vault = MagicMock(spec=EvolutionVault)
         self.hive = MagicMock(spec=HiveBridge)
-        # Mock HiveBridge's call_llm_sync and get_summary
-        self.hive.call_llm_sync = AsyncMock(return_value='{"revelations": [{"content": "Test Revelation", "tag": "rigor↑"}], "ahas": ["AHA: Test Insight"]}')
+        # Mock HiveBridge's call_llm_batch and get_summary
+        response = '{"revelations": [{"content": "Test Revelation", "tag": "rigor↑"}], "ahas": ["AHA: Test Insight"]}'
+        self.hive.call_llm_batch = AsyncMock(side_effect=lambda prompts: [response] * len(prompts))
         self.hive.get_summary = MagicMock(return_value="HiveBridge: 25/25 modules loaded\nτ=1.0000 J=1.0000")
         
-        self.engine = ResearchEngine(self.hive, self.vault)
+        self.settings = MagicMock(spec=SettingsService)
+
+        self.engine = ResearchEngine(self.hive, self.vault, self.settings)
 
     async def test_conduct_research_cycle(self):
         """Test a full research cycle with epiphany generation and synthesis."""
@@ -39,6 +43,31 @@ class TestResearchEngine(unittest.IsolatedAsyncioTestCase):
         # Verify vault logging
         self.vault.log_evolution.assert_called()
         
+    async def test_failed_batch_responses_fall_back_to_mock(self):
+        """None entries from call_llm_batch become mock epiphanies; order is kept."""
+        self.hive.call_llm_batch = AsyncMock(
+            side_effect=lambda prompts: ["ok" if i % 2 else None for i in range(len(prompts))])
+        result = await self.engine.conduct_research("batched epiphanies")
+
+        prompts = self.hive.call_llm_batch.await_args.args[0]
+        self.assertEqual(len(prompts), result["epiphanyCount"])
+        for i, epiphany in enumerate(result["epiphanies"]):
+            self.assertEqual(epiphany["id"], i)
+            self.assertEqual(len(epiphany["vector"]), 8)
+            first = epiphany["revelations"][0]["content"]
+            if i % 2:
+                self.assertTrue(first.startswith(f"Atomic Revelation {i}."))
+            else:
+                self.assertEqual(first, f"Mock Revelation {i}")
+
+    async def test_batch_error_falls_back_to_mock(self):
+        """A batch call that raises still yields a full set of mock epiphanies."""
+        self.hive.call_llm_batch = AsyncMock(side_effect=RuntimeError("router down"))
+        result = await self.engine.conduct_research("offline")
+        self.assertGreaterEqual(result["epiphanyCount"], 8)
+        self.assertTrue(all(e["revelations"][0]["content"].startswith("Mock Revelation")
+                            for e in result["epiphanies"]))
+
     def test_calculate_coherence(self):
         """Test Clifford coherence calculation."""
         epiphanies = [
@@ -10,11 +10,12 @@ import uvicorn
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from src.sdk.sra_client import SRAClient
-from src.server.app import app
 
 class TestSDKConnectivity(unittest.TestCase):
     @classmethod
     def setUpClass(cls):
+        # Imported here, not at collection, so the app's vault lands in the test temp dir
+        from src.server.app import app
         # Start the server in a background thread
         cls.server_thread = threading.Thread(
             target=uvicorn.run, 
@@ -42,5 +42,21 @@ class TestSearchService(unittest.IsolatedAsyncioTestCase):
         # Ensure log_evolution was NOT called (no new search performed)
         self.vault.log_evolution.assert_not_called()
 
+    async def test_cache_hit_returns_copies_trimmed_to_count(self):
+        """Cached results are sliced to `count` and edits by the caller do not reach the cache."""
+        first = await self.service.search("copy query", count=2)
+        first[0]["title"] = "edited"
+        again = await self.service.search("copy query", count=1)
+        self.assertEqual(len(again), 1)
+        self.assertNotEqual(again[0]["title"], "edited")
+        self.vault.log_evolution.assert_called_once()
+
+    async def test_cache_miss_when_more_results_requested(self):
+        """A cache entry fetched with a smaller count does not answer a larger request."""
+        await self.service.search("count query", count=1)
+        results = await self.service.search("count query", count=2)
+        self.assertEqual(len(results), 2)
+        self.assertEqual(self.vault.log_evolution.call_count, 2)
+
 if __name__ == "__main__":
     unittest.main()
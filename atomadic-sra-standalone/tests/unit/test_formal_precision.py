@@ -0,0 +1,57 @@
+"""
+Unit Tests — FormalPrecisionLayer caching and structural equivalence
+
+Kept apart from test_core_stack.py so they run on their own imports.
+"""
+
+import sys
+import os
+
+# Ensure project root is importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..')))
+
+from src.core.formal_precision import FormalPrecisionLayer
+
+
+class TestVerifiedProofs:
+
+    def test_verified_proofs_deduplicated(self):
+        fpl = FormalPrecisionLayer()
+        proof = {"name": "repeat", "hypothesis": "A", "conclusion": "A"}
+        fpl.verify_proof(proof)
+        fpl.verify_proof(proof)
+        assert fpl.get_verified_count() == 1
+        assert "repeat" in fpl.verified_proofs
+
+
+class TestEquivalence:
+
+    def test_check_equivalence_cache_invalidated_on_define(self):
+        fpl = FormalPrecisionLayer()
+        fpl.define_type("A", {"kind": "product"})
+        fpl.define_type("B", {"kind": "sum"})
+        assert fpl.check_equivalence("A", "B") is False
+        assert fpl.check_equivalence("B", "A") is False
+        fpl.define_type("B", {"kind": "product"})
+        assert fpl.check_equivalence("B", "A") is True
+
+    def test_check_equivalence_cyclic_structures(self):
+        fpl = FormalPrecisionLayer()
+        a = {"kind": "stream"}
+        a["tail"] = a
+        b = {"kind": "stream"}
+        b["tail"] = b
+        fpl.define_type("A", a)
+        fpl.define_type("B", b)
+        assert fpl.check_equivalence("A", "B") is True
+
+    def test_define_type_isolated_from_caller_mutation(self):
+        fpl = FormalPrecisionLayer()
+        s1 = {"fields": ["a", "b"]}
+        fpl.define_type("A", s1)
+        s1["fields"].append("c")
+        fpl.define_type("C", {"fields": ["a", "b"]})
+        fpl.define_type("D", {"fields": ["a", "b", "c"]})
+        assert fpl.check_equivalence("A", "C") is True
+        assert fpl.check_equivalence("A", "D") is False
+        assert fpl.type_universe["C"]["structure"] == {"fields": ["a", "b"]}
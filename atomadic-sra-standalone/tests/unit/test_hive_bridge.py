@@ -57,6 +57,36 @@ class TestHiveBridgeInit:
         assert "J" in state
         assert "modules" in state
 
+    def test_get_state_mutation_does_not_leak(self):
+        from src.core.hive_bridge import HiveBridge
+        bridge = HiveBridge()
+        state = bridge.get_state()
+        agent = state["agents"]["agent"]
+        state["agents"]["agent"] = not agent
+        state["injected"] = True
+        state["modules"]["memory"] = "injected"
+        state["governance"]["features"]["injected"] = True
+        again = bridge.get_state()
+        assert "injected" not in again
+        assert again["agents"]["agent"] == agent
+        assert again["modules"]["memory"] != "injected"
+        assert "injected" not in again["governance"]["features"]
+
+    def test_state_probes_stay_cheap(self):
+        # Timing guard, relative to a deepcopy of the state so it holds on any machine:
+        # building the state fresh (and the summary from cached flags) must stay well
+        # below the cost of copying a cached snapshot
+        import copy
+        import timeit
+        from src.core.hive_bridge import HiveBridge
+        bridge = HiveBridge()
+        state = bridge.get_state()
+        bridge.get_summary()
+        best = lambda f: min(timeit.repeat(f, number=200, repeat=5))
+        clone = best(lambda: copy.deepcopy(state))
+        assert best(bridge.get_state) < clone / 2
+        assert best(bridge.get_summary) < clone / 2
+
 
 class TestHiveBridgeLeech:
     """Test Leech lattice encoding/correction via HiveBridge."""
@@ -83,6 +113,15 @@ class TestHiveBridgeLeech:
         assert len(corrected) == 24
         assert isinstance(syndrome, int)
 
+    def test_batch_correct_fallback_meta_independent(self):
+        from src.core.hive_bridge import HiveBridge
+        bridge = HiveBridge()
+        bridge._golay_available = False
+        corrected, syndromes, meta = bridge.batch_correct(np.full((3, 24), 0.4))
+        assert corrected.shape == (3, 24)
+        meta[0]["repaired"] = True
+        assert meta[1] == {"syndrome": -1, "repaired": False}
+
     def test_leech_encode_idempotent_on_integers(self):
         from src.core.hive_bridge import HiveBridge
         bridge = HiveBridge()
@@ -98,6 +137,20 @@ class TestHiveBridgeLeech:
         corrected, syndrome = bridge.leech_correct(vec)
         assert np.all(corrected == 0)
 
+    def test_golay_syndrome_matches_memory(self):
+        from src.core.hive_bridge import HiveBridge
+        bridge = HiveBridge()
+        bridge._ensure_golay()
+        if not bridge._golay_available:
+            assert bridge.golay_syndrome([1, 0, 1] + [0] * 21) == -1
+            return
+        import memory
+        rng = np.random.default_rng(0)
+        for _ in range(200):
+            vec = rng.integers(-3, 4, size=24)
+            assert bridge.golay_syndrome(vec) == memory.LeechErrorCorrector.syndrome(vec)
+            assert bridge.golay_syndrome(vec.tolist()) == memory.LeechErrorCorrector.syndrome(vec)
+
 
 class TestHiveBridgeHD:
     """Test HD/RHC encoding via HelixHive memory."""
@@ -118,6 +171,56 @@ class TestHiveBridgeHD:
         if r1 is not None and r2 is not None:
             assert np.array_equal(r1, r2)
 
+    def test_hd_similarity_bipolar_int8(self):
+        from src.core.hive_bridge import HiveBridge, _HM
+        bridge = HiveBridge()
+        mem = bridge._m(_HM.memory)
+        if mem is None:
+            pytest.skip("HelixHive memory not loaded")
+        dim = mem.HD.DIM
+        v1 = np.tile(np.array([1, -1, 1, -1], dtype=np.int8), dim // 4)
+        v2 = np.tile(np.array([1, 1, 1, -1], dtype=np.int8), dim // 4)
+        assert bridge.hd_similarity(v1, v1) == 1.0
+        assert bridge.hd_similarity(v1, v2) == 0.5
+        assert bridge.hd_similarity(v1, v2) == mem.HD.sim(v1, v2)
+
+        def pack(v):
+            bits = np.zeros(-(-dim // 64) * 64, dtype=bool)
+            bits[:dim] = v < 0
+            return np.packbits(bits).view(np.uint64)
+        assert bridge.hd_similarity(pack(v1), pack(v2)) == 0.5
+        short = np.array([1, -1, 1, -1], dtype=np.int8)
+        assert bridge.hd_similarity(short, short) is None
+
+    def test_hd_bind_int8_and_packed_agree(self):
+        from src.core.hive_bridge import HiveBridge, _HM
+        bridge = HiveBridge()
+        mem = bridge._m(_HM.memory)
+        if mem is None:
+            pytest.skip("HelixHive memory not loaded")
+        dim = mem.HD.DIM
+        rng = np.random.default_rng(0)
+        v1 = rng.choice(np.array([-1, 1], dtype=np.int8), dim)
+        v2 = rng.choice(np.array([-1, 1], dtype=np.int8), dim)
+        bound = bridge.hd_bind(v1, v2)
+        assert bound.dtype == np.int8
+        np.testing.assert_array_equal(bound, mem.HD.bind(v1, v2))
+
+        # Packed form: bit=1 ↔ -1, so XOR of the bits is the sign of the product
+        def pack(v):
+            bits = np.zeros(-(-dim // 64) * 64, dtype=bool)
+            bits[:dim] = v < 0
+            return np.packbits(bits).view(np.uint64)
+        np.testing.assert_array_equal(bridge.hd_bind(pack(v1), pack(v2)), pack(bound))
+
+    def test_hd_bind_rejects_wrong_dimension(self):
+        from src.core.hive_bridge import HiveBridge
+        bridge = HiveBridge()
+        v = np.ones(128, dtype=np.int8)
+        assert bridge.hd_bind(v, v) is None
+        packed = np.zeros(2, dtype=np.uint64)
+        assert bridge.hd_bind(packed, packed) is None
+
     def test_rhc_encode_trait_value(self):
         from src.core.hive_bridge import HiveBridge
         bridge = HiveBridge()
@@ -133,6 +236,35 @@ class TestHiveBridgeHD:
         if result is not None:
             assert len(result) == 8
 
+    def test_e8_fallback_matches_memory(self):
+        from src.core.hive_bridge import HiveBridge, _HM
+        bridge = HiveBridge()
+        fallback = HiveBridge()
+        fallback._mod_cache[_HM.memory] = None
+        if bridge.e8_closest_point(np.zeros(8)) is None:
+            pytest.skip("memory module unavailable")
+        rng = np.random.default_rng(0)
+        for _ in range(50):
+            v = rng.normal(scale=2.0, size=8)
+            np.testing.assert_array_equal(fallback.e8_closest_point(v), bridge.e8_closest_point(v))
+
+
+class TestHiveBridgeAgents:
+    """Test standalone agent trait helpers."""
+
+    def test_mutate_agent_traits_clipped_to_unit_interval(self):
+        from src.core.hive_bridge import HiveBridge
+        bridge = HiveBridge()
+        traits = {"curiosity": 0.0, "rigor": 1.0, "speed": 0.5}
+        mutated = bridge.mutate_agent_traits(traits, mutation_rate=5.0)
+        assert list(mutated) == list(traits)
+        assert all(0.0 <= v <= 1.0 for v in mutated.values())
+
+    def test_mutate_agent_traits_empty(self):
+        from src.core.hive_bridge import HiveBridge
+        bridge = HiveBridge()
+        assert bridge.mutate_agent_traits({}) == {}
+
 
 class TestHiveBridgeLLM:
     """Test LLM routing fallback behavior."""
@@ -150,6 +282,52 @@ class TestHiveBridgeLLM:
         # Either None or a string
         assert result is None or isinstance(result, str)
 
+    def test_call_llm_batch_keeps_order_and_marks_failures(self):
+        import asyncio
+        import types
+        from src.core.hive_bridge import HiveBridge, _HM
+
+        async def call_llm(prompt, **kwargs):
+            if prompt == "bad":
+                raise RuntimeError("provider error")
+            await asyncio.sleep(0.01 if prompt == "slow" else 0)
+            return prompt.upper()
+
+        bridge = HiveBridge()
+        bridge._mod_cache[_HM.llm_router] = types.SimpleNamespace(call_llm=call_llm)
+        result = asyncio.run(bridge.call_llm_batch(["slow", "bad", "fast"]))
+        assert result == ["SLOW", None, "FAST"]
+
+    def test_call_llm_batch_without_router(self):
+        import asyncio
+        from src.core.hive_bridge import HiveBridge, _HM
+        bridge = HiveBridge()
+        bridge._mod_cache[_HM.llm_router] = None
+        assert asyncio.run(bridge.call_llm_batch(["a", "b"])) == [None, None]
+
+    def test_call_llm_sync_shares_one_loop(self):
+        import threading
+        import types
+        import src.core.hive_bridge as hb
+
+        async def call_llm(prompt, **kwargs):
+            return prompt.upper()
+
+        router = types.SimpleNamespace(call_llm=call_llm)
+        bridges = [hb.HiveBridge() for _ in range(3)]
+        for bridge in bridges:
+            bridge._mod_cache[hb._HM.llm_router] = router
+        assert [b.call_llm_sync("hi") for b in bridges] == ["HI"] * 3
+        loops = [t for t in threading.enumerate() if t.name == "HiveBridgeLoop"]
+        assert len(loops) == 1
+
+        loop, thread = hb._bg_loop, hb._bg_thread
+        hb._stop_bg_loop()
+        assert not thread.is_alive()
+        assert loop.is_closed()
+        # A later call starts a fresh loop
+        assert bridges[0].call_llm_sync("again") == "AGAIN"
+
 
 class TestHiveBridgeRevelation:
     """Test Revelation Engine probe."""
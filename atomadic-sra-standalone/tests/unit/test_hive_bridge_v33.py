@@ -71,6 +71,19 @@ class TestHiveBridgeFull:
         assert "faction_manager_available" in info
         assert "dbscan_clustering" in info["capabilities"]
 
+    def test_info_probes_are_read_only(self):
+        import json
+        from src.core.hive_bridge import HiveBridge, thaw_info
+        bridge = HiveBridge()
+        info = bridge.get_governance_info()
+        assert bridge.get_governance_info() is info
+        with pytest.raises(TypeError):
+            info["features"]["injected"] = True
+        plain = thaw_info(info)
+        json.dumps(plain)
+        plain["features"]["injected"] = True
+        assert "injected" not in bridge.get_governance_info()["features"]
+
 
 class TestHiveAgentAdapterExpanded:
     """Test expanded HiveAgentAdapter capabilities."""